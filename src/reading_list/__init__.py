@@ -7,4 +7,13 @@ a comprehensive, categorized reading list with beautiful visualizations.
 
 from .version import __version__
 
-__all__ = ["__version__"] 
\ No newline at end of file
+__all__ = ["__version__", "Pipeline"]
+
+
+def __getattr__(name: str):
+    """Lazily import the pipeline so importing the package stays cheap."""
+    if name == "Pipeline":
+        from .pipeline import Pipeline
+
+        return Pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
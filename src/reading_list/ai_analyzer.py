@@ -1,27 +1,240 @@
 """AI analyzer module for GitHub Reading List Generator."""
 
-# Placeholder for AI analysis functionality
-# This will be implemented in future iterations
+import asyncio
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+
+from .config import Config
+from .github_client import Repository
+from .rate_limit import RateLimiter, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_API_VERSION = "2023-06-01"
+
+# Statuses worth retrying: rate limited or transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+ANALYSIS_PROMPT = """Categorize the following GitHub repository and summarize it in one sentence.
+Respond with a JSON object with the keys "category" and "summary" only.
+
+Name: {name}
+Language: {language}
+Topics: {topics}
+Description: {description}
+"""
+
+BATCH_ANALYSIS_PROMPT = """Categorize each of the following GitHub repositories and summarize each in one sentence.
+Respond with a JSON array containing one object per repository, with the keys
+"full_name", "category" and "summary" only.
+
+{repositories}
+"""
+
+
+def _batched(items: List[Repository], size: int) -> Iterator[List[Repository]]:
+    """Split items into consecutive lists of at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class AIAnalyzer:
     """AI analyzer for repository analysis."""
-    
-    def __init__(self, config):
+
+    def __init__(self, config: Config):
         self.config = config
-    
-    async def analyze_repository(self, repository):
-        """Analyze a single repository."""
-        # Placeholder implementation
+        self._sem = asyncio.Semaphore(config.performance.max_concurrent_analysis)
+        self._limiter = RateLimiter()
+
+    def provider_enabled(self) -> bool:
+        """Check whether the configured AI provider can be called."""
+        provider = self.config.ai.provider
+        if provider == "openai":
+            return bool(self.config.ai.openai.api_key)
+        if provider == "anthropic":
+            return bool(self.config.ai.anthropic.api_key)
+        return False
+
+    def _build_request(self, prompt: str) -> Tuple[str, Dict, Dict]:
+        """Build the URL, headers and payload for the configured AI provider."""
+        message = {"role": "user", "content": prompt}
+
+        if self.config.ai.provider == "anthropic":
+            anthropic = self.config.ai.anthropic
+            return (
+                ANTHROPIC_API_URL,
+                {
+                    "x-api-key": anthropic.api_key,
+                    "anthropic-version": ANTHROPIC_API_VERSION,
+                },
+                {
+                    "model": anthropic.model,
+                    "max_tokens": anthropic.max_tokens,
+                    "temperature": anthropic.temperature,
+                    "messages": [message],
+                },
+            )
+
+        openai = self.config.ai.openai
+        return (
+            f"{openai.base_url.rstrip('/')}/chat/completions",
+            {"Authorization": f"Bearer {openai.api_key}"},
+            {
+                "model": openai.model,
+                "max_tokens": openai.max_tokens,
+                "temperature": openai.temperature,
+                "messages": [message],
+            },
+        )
+
+    async def _complete(self, session: aiohttp.ClientSession, prompt: str) -> str:
+        """Send a prompt to the configured AI provider and return the reply text.
+
+        Requests are bounded by ``performance.max_concurrent_analysis`` and the
+        per-host rate limiter, and retried with exponential backoff on
+        rate-limit and server errors up to ``github.retry_attempts`` times.
+        Raises ValueError when the reply does not have the expected shape.
+        """
+        url, headers, payload = self._build_request(prompt)
+        host = urlsplit(url).netloc
+        retry_attempts = self.config.github.retry_attempts
+
+        for attempt in range(retry_attempts + 1):
+            try:
+                async with self._sem, self._limiter(host):
+                    async with session.post(url, headers=headers, json=payload) as response:
+                        self._limiter.update(host, response.headers)
+                        response.raise_for_status()
+                        data = orjson.loads(await response.read())
+                        break
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == retry_attempts:
+                    raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == retry_attempts:
+                    raise
+
+            delay = backoff_delay(attempt)
+            logger.debug(f"Retrying {host} request in {delay:.1f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+        try:
+            if self.config.ai.provider == "anthropic":
+                text = data["content"][0]["text"]
+            else:
+                text = data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Unexpected {host} response shape: {e!r}") from e
+
+        if not isinstance(text, str):
+            raise ValueError(f"Unexpected {host} response shape: no reply text")
+        return text
+
+    @staticmethod
+    def _fallback_analysis(repository: Repository) -> Dict:
+        """Analysis derived from repository metadata alone."""
         return {
             "category": repository.language or "Unknown",
             "summary": repository.description or "No description available",
         }
-    
-    async def analyze_repositories(self, repositories):
-        """Analyze multiple repositories."""
-        # Placeholder implementation
-        results = []
-        for repo in repositories:
-            result = await self.analyze_repository(repo)
-            results.append(result)
-        return results 
\ No newline at end of file
+
+    @staticmethod
+    def _merge_analysis(result: Optional[Dict], fallback: Dict) -> Dict:
+        """Fill missing values of an AI result from the fallback analysis."""
+        if not isinstance(result, dict):
+            return fallback
+
+        return {
+            "category": result.get("category") or fallback["category"],
+            "summary": result.get("summary") or fallback["summary"],
+        }
+
+    async def analyze_repository(
+        self,
+        repository: Repository,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Dict:
+        """Analyze a single repository."""
+        fallback = self._fallback_analysis(repository)
+
+        if session is None or not self.provider_enabled():
+            return fallback
+
+        prompt = ANALYSIS_PROMPT.format(
+            name=repository.full_name,
+            language=repository.language or "Unknown",
+            topics=", ".join(repository.topics) or "none",
+            description=repository.description or "No description",
+        )
+
+        try:
+            result = orjson.loads(await self._complete(session, prompt))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+            logger.warning(f"AI analysis failed for {repository.full_name}: {e}")
+            return fallback
+
+        return self._merge_analysis(result, fallback)
+
+    async def _analyze_batch(
+        self,
+        repositories: List[Repository],
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> List[Dict]:
+        """Analyze a batch of repositories with a single AI request."""
+        fallbacks = [self._fallback_analysis(repo) for repo in repositories]
+
+        if session is None or not self.provider_enabled():
+            return fallbacks
+
+        items = [
+            {
+                "full_name": repo.full_name,
+                "language": repo.language,
+                "topics": repo.topics,
+                "description": repo.description,
+            }
+            for repo in repositories
+        ]
+        prompt = BATCH_ANALYSIS_PROMPT.format(
+            repositories=orjson.dumps(items, option=orjson.OPT_INDENT_2).decode()
+        )
+
+        try:
+            results = orjson.loads(await self._complete(session, prompt))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+            logger.warning(f"AI analysis failed for a batch of {len(repositories)}: {e}")
+            return fallbacks
+
+        if not isinstance(results, list):
+            return fallbacks
+
+        # Match by name rather than position in case the model drops or reorders items
+        by_name = {
+            result.get("full_name"): result
+            for result in results
+            if isinstance(result, dict)
+        }
+        return [
+            self._merge_analysis(by_name.get(repo.full_name), fallback)
+            for repo, fallback in zip(repositories, fallbacks, strict=True)
+        ]
+
+    async def analyze_repositories(self, repositories: List[Repository]) -> List[Dict]:
+        """Analyze repositories in concurrent batches of ``ai.batch_size``."""
+        batch_size = max(1, self.config.ai.batch_size)
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            batches = await asyncio.gather(
+                *[
+                    self._analyze_batch(batch, session)
+                    for batch in _batched(repositories, batch_size)
+                ]
+            )
+
+        return [result for batch in batches for result in batch]
@@ -0,0 +1,51 @@
+"""On-disk cache for GitHub Reading List Generator."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStore:
+    """Key/value store keeping one JSON file per entry in a directory.
+
+    Entries are written to a temporary file and moved into place, so a
+    crashed run never leaves a truncated entry behind.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key from arbitrary parts."""
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached entry for key, or None."""
+        try:
+            return orjson.loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, entry: Dict) -> None:
+        """Store entry under key."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
@@ -1,23 +1,63 @@
 """Command-line interface for GitHub Reading List Generator."""
 
-import asyncio
-import json
+import functools
 import os
+import stat
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from .config import Config, load_config
-from .pipeline import Pipeline
+from .config import Config, SafeDumper, load_config
 from .version import __version__
 
-console = Console()
+# Heavier imports (rich renderables, the pipeline and its HTTP stack, yaml)
+# are deferred to the commands that use them to keep --help and shell
+# completion fast.
+
+# Markup is explicit everywhere, so skip Rich's automatic regex highlighting
+console = Console(highlight=False)
+
+# Command banners as (markup, border style)
+_REFRESH_BANNER = ("🔄 [bold blue]Refreshing Reading List[/bold blue]", "blue")
+_SERVE_BANNER = ("🌐 [bold magenta]Starting Web Dashboard[/bold magenta]", "magenta")
+_INIT_BANNER = ("🎯 [bold cyan]Initializing Reading List Generator[/bold cyan]", "cyan")
+_STATUS_BANNER = ("📊 [bold blue]Reading List Status[/bold blue]", "blue")
+
+
+@functools.lru_cache(maxsize=None)
+def _banner(text: str, border_style: str):
+    """Build a banner panel once and reuse it."""
+    from rich.panel import Panel
+
+    return Panel.fit(text, border_style=border_style)
+
+
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    import asyncio
+
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+
+    return asyncio.run(coro)
+
+
+def _load_config_or_exit(config_path: Path) -> Config:
+    """Load configuration, exiting with an error message on failure."""
+    try:
+        return load_config(config_path)
+    except Exception as e:
+        console.print(f"[red]Error loading configuration: {e}[/red]")
+        sys.exit(1)
 
 
 @click.group()
@@ -40,12 +80,7 @@ def cli(ctx: click.Context, config: Optional[Path], debug: bool) -> None:
     ctx.obj["debug"] = debug
     
     # Load configuration
-    config_path = config or Path("config.yaml")
-    try:
-        ctx.obj["config"] = load_config(config_path)
-    except Exception as e:
-        console.print(f"[red]Error loading configuration: {e}[/red]")
-        sys.exit(1)
+    ctx.obj["config"] = _load_config_or_exit(config or Path("config.yaml"))
 
 
 @cli.command()
@@ -62,12 +97,14 @@ def cli(ctx: click.Context, config: Optional[Path], debug: bool) -> None:
 @click.pass_context
 def refresh(ctx: click.Context, force: bool, no_ai: bool) -> None:
     """Refresh the reading list data from GitHub."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from .pipeline import Pipeline
+
     config: Config = ctx.obj["config"]
     
-    console.print(Panel.fit(
-        "🔄 [bold blue]Refreshing Reading List[/bold blue]",
-        border_style="blue"
-    ))
+    console.print(_banner(*_REFRESH_BANNER))
     
     # Validate GitHub token
     if not config.github.token:
@@ -86,7 +123,7 @@ def refresh(ctx: click.Context, force: bool, no_ai: bool) -> None:
         
         try:
             # Run async pipeline
-            result = asyncio.run(pipeline.run(force_refresh=force, skip_ai=no_ai))
+            result = _run_async(pipeline.run(force_refresh=force, skip_ai=no_ai))
             
             progress.update(task, description="Complete!")
             
@@ -118,7 +155,7 @@ def refresh(ctx: click.Context, force: bool, no_ai: bool) -> None:
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["json", "csv", "html", "markdown"]),
+    type=click.Choice(["json", "csv", "html", "markdown", "parquet"]),
     default="json",
     help="Export format",
 )
@@ -136,12 +173,13 @@ def refresh(ctx: click.Context, force: bool, no_ai: bool) -> None:
 @click.pass_context
 def export(ctx: click.Context, format: str, output: Optional[Path], pretty: bool) -> None:
     """Export reading list data in various formats."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .pipeline import Pipeline
+
     config: Config = ctx.obj["config"]
     
-    console.print(Panel.fit(
-        f"📤 [bold green]Exporting to {format.upper()}[/bold green]",
-        border_style="green"
-    ))
+    console.print(_banner(f"📤 [bold green]Exporting to {format.upper()}[/bold green]", "green"))
     
     # Determine output path
     if not output:
@@ -158,7 +196,7 @@ def export(ctx: click.Context, format: str, output: Optional[Path], pretty: bool
             task = progress.add_task(f"Exporting to {format}...", total=None)
             
             # Export data
-            result = asyncio.run(pipeline.export(format, output, pretty_json=pretty))
+            result = _run_async(pipeline.export(format, output, pretty_json=pretty))
             
             progress.update(task, description="Complete!")
             
@@ -195,10 +233,7 @@ def serve(ctx: click.Context, host: str, port: int, reload: bool) -> None:
     """Start the web dashboard server."""
     config: Config = ctx.obj["config"]
     
-    console.print(Panel.fit(
-        f"🌐 [bold magenta]Starting Web Dashboard[/bold magenta]",
-        border_style="magenta"
-    ))
+    console.print(_banner(*_SERVE_BANNER))
     
     try:
         import uvicorn
@@ -247,10 +282,9 @@ def serve(ctx: click.Context, host: str, port: int, reload: bool) -> None:
 @click.pass_context
 def init(ctx: click.Context, username: str, token: Optional[str], force: bool) -> None:
     """Initialize configuration files and directories."""
-    console.print(Panel.fit(
-        "🎯 [bold cyan]Initializing Reading List Generator[/bold cyan]",
-        border_style="cyan"
-    ))
+    import yaml
+
+    console.print(_banner(*_INIT_BANNER))
     
     config_path = Path("config.yaml")
     env_path = Path(".env")
@@ -263,16 +297,8 @@ def init(ctx: click.Context, username: str, token: Optional[str], force: bool) -
     
     try:
         # Create directories
-        directories = [
-            "data",
-            "data/cache",
-            "data/exports", 
-            "data/logs",
-            "templates",
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        config: Config = ctx.obj["config"]
+        config.create_directories()
             
         # Create .env file
         env_content = f"""# GitHub Reading List Generator Environment Variables
@@ -292,13 +318,17 @@ DATABASE_URL=sqlite:///data/reading_list.db
         env_path.write_text(env_content)
         
         # Update config.yaml with username
-        config = load_config()
         config.github.username = username
         
         # Save updated config
-        import yaml
         with open(config_path, "w") as f:
-            yaml.dump(config.dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(
+                config.model_dump(mode="json", exclude_none=True),
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                indent=2,
+            )
         
         console.print("[green]✅ Configuration initialized successfully![/green]")
         console.print(f"[blue]📄 Configuration file: {config_path}[/blue]")
@@ -321,12 +351,14 @@ DATABASE_URL=sqlite:///data/reading_list.db
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show current status and configuration."""
-    config: Config = ctx.obj["config"]
-    
-    console.print(Panel.fit(
-        "📊 [bold blue]Reading List Status[/bold blue]",
-        border_style="blue"
-    ))
+    _status_impl(ctx.obj["config"])
+
+
+def _status_impl(config: Config) -> None:
+    """Print configuration and file system status."""
+    from rich.table import Table
+
+    console.print(_banner(*_STATUS_BANNER))
     
     # Configuration status
     config_table = Table(title="⚙️ Configuration")
@@ -360,25 +392,43 @@ def status(ctx: click.Context) -> None:
     ]
     
     for path in paths_to_check:
-        if path.exists():
-            if path.is_dir():
-                size = f"{len(list(path.iterdir()))} items"
-            else:
-                size = f"{path.stat().st_size} bytes"
-            status = "✅ Exists"
-        else:
+        # One stat per path; directory entries are counted without building Paths
+        try:
+            path_stat = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             size = "-"
             status = "❌ Missing"
+        else:
+            if stat.S_ISDIR(path_stat.st_mode):
+                with os.scandir(path) as entries:
+                    size = f"{sum(1 for _ in entries)} items"
+            else:
+                size = f"{path_stat.st_size} bytes"
+            status = "✅ Exists"
         
         fs_table.add_row(str(path), status, size)
     
     console.print(fs_table)
 
 
-def main():
-    """Entry point for the CLI."""
-    return cli()
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the CLI.
+
+    ``--version`` and a bare ``status`` are answered without building
+    Click's parser and context; everything else is dispatched to Click.
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if args == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])}, version {__version__}")
+        return 0
+
+    if args == ["status"]:
+        _status_impl(_load_config_or_exit(Path("config.yaml")))
+        return 0
+
+    return cli(args=argv)
 
 
 if __name__ == "__main__":
-    cli() 
\ No newline at end of file
+    main() 
\ No newline at end of file
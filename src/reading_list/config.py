@@ -1,15 +1,41 @@
 """Configuration management for GitHub Reading List Generator."""
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # LibYAML bindings not available
+    from yaml import SafeDumper, SafeLoader
 
-class GitHubConfig(BaseModel):
+# Environment variables that override file settings, snapshotted once at
+# import; call Config.reload_env() after changing them at runtime.
+_ENV_VARS = ("GITHUB_TOKEN", "GITHUB_USERNAME", "OPENAI_API_KEY", "ANTHROPIC_API_KEY")
+_ENV: Dict[str, Optional[str]] = {name: os.environ.get(name) for name in _ENV_VARS}
+
+# Subdirectories of output.data_dir created by Config.create_directories()
+DATA_SUBDIRECTORIES = ("cache", "exports", "logs")
+
+
+class _ConfigModel(BaseModel):
+    """Base for configuration sections.
+
+    Validators are built on first use rather than at import, which keeps
+    commands that never construct a Config (--help, completion) fast.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class GitHubConfig(_ConfigModel):
     """GitHub API configuration."""
     username: str = "your-username"
     token: Optional[str] = Field(default=None, alias="GITHUB_TOKEN")
@@ -20,9 +46,10 @@ class GitHubConfig(BaseModel):
     retry_delay: int = 1
     cache_ttl: int = 3600
     enable_cache: bool = True
+    use_graphql: bool = False
 
 
-class OpenAIConfig(BaseModel):
+class OpenAIConfig(_ConfigModel):
     """OpenAI API configuration."""
     api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     model: str = "gpt-4"
@@ -31,7 +58,7 @@ class OpenAIConfig(BaseModel):
     base_url: str = "https://api.openai.com/v1"
 
 
-class AnthropicConfig(BaseModel):
+class AnthropicConfig(_ConfigModel):
     """Anthropic API configuration."""
     api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
     model: str = "claude-3-sonnet-20240229"
@@ -39,7 +66,7 @@ class AnthropicConfig(BaseModel):
     temperature: float = 0.3
 
 
-class AIConfig(BaseModel):
+class AIConfig(_ConfigModel):
     """AI analysis configuration."""
     provider: str = "openai"  # "openai", "anthropic", or "none"
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
@@ -50,7 +77,7 @@ class AIConfig(BaseModel):
     batch_size: int = 10
 
 
-class TimelineConfig(BaseModel):
+class TimelineConfig(_ConfigModel):
     """Timeline visualization configuration."""
     x_axis: str = "stars"
     y_axis: str = "starred_date"
@@ -59,14 +86,14 @@ class TimelineConfig(BaseModel):
     show_trends: bool = True
 
 
-class CategoryConfig(BaseModel):
+class CategoryConfig(_ConfigModel):
     """Category visualization configuration."""
     chart_type: str = "treemap"
     min_repos: int = 2
     max_categories: int = 15
 
 
-class VisualizationConfig(BaseModel):
+class VisualizationConfig(_ConfigModel):
     """Visualization configuration."""
     theme: str = "dark"
     formats: List[str] = Field(default_factory=lambda: ["html", "png", "svg"])
@@ -77,7 +104,7 @@ class VisualizationConfig(BaseModel):
     categories: CategoryConfig = Field(default_factory=CategoryConfig)
 
 
-class ReadmeConfig(BaseModel):
+class ReadmeConfig(_ConfigModel):
     """README generation configuration."""
     template: str = "templates/README_template.md"
     filename: str = "READING_LIST.md"
@@ -86,14 +113,14 @@ class ReadmeConfig(BaseModel):
     group_by_category: bool = True
 
 
-class ExportConfig(BaseModel):
+class ExportConfig(_ConfigModel):
     """Export configuration."""
     include_metadata: bool = True
     pretty_json: bool = True
     csv_delimiter: str = ","
 
 
-class OutputConfig(BaseModel):
+class OutputConfig(_ConfigModel):
     """Output configuration."""
     data_dir: str = "data"
     formats: List[str] = Field(default_factory=lambda: ["json", "csv", "html", "markdown"])
@@ -101,7 +128,7 @@ class OutputConfig(BaseModel):
     export: ExportConfig = Field(default_factory=ExportConfig)
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(_ConfigModel):
     """Database configuration."""
     path: str = "data/reading_list.db"
     timeout: int = 30
@@ -110,20 +137,20 @@ class DatabaseConfig(BaseModel):
     backup_frequency: str = "weekly"
 
 
-class LogFileConfig(BaseModel):
+class LogFileConfig(_ConfigModel):
     """Log file configuration."""
     application: str = "data/logs/application.log"
     github_api: str = "data/logs/github_api.log"
     ai_analysis: str = "data/logs/ai_analysis.log"
 
 
-class ConsoleConfig(BaseModel):
+class ConsoleConfig(_ConfigModel):
     """Console logging configuration."""
     enabled: bool = True
     level: str = "INFO"
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging configuration."""
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -133,17 +160,17 @@ class LoggingConfig(BaseModel):
     console: ConsoleConfig = Field(default_factory=ConsoleConfig)
 
 
-class PerformanceConfig(BaseModel):
+class PerformanceConfig(_ConfigModel):
     """Performance configuration."""
     max_concurrent_requests: int = 10
-    max_concurrent_analysis: int = 5
+    max_concurrent_analysis: int = Field(default=5, ge=1)
     batch_size: int = 100
     cache_size: int = 1000
     max_memory_mb: int = 1024
     request_delay: float = 0.1
 
 
-class FeatureConfig(BaseModel):
+class FeatureConfig(_ConfigModel):
     """Feature flags configuration."""
     enable_ai_analysis: bool = True
     enable_visualizations: bool = True
@@ -152,7 +179,80 @@ class FeatureConfig(BaseModel):
     enable_social_features: bool = False
 
 
-class CategorizationConfig(BaseModel):
+class KeywordAutomaton:
+    """Single-pass keyword matcher over categorization keywords.
+
+    Uses a pyahocorasick automaton when installed, so matching is linear in
+    the text length regardless of how many keywords are configured, and
+    falls back to one precompiled regular expression otherwise. Matches must
+    not be preceded or followed by a letter or digit (``str.isalnum``); both
+    backends report the same matches in the same order.
+    """
+
+    def __init__(self, keywords: Dict[str, Tuple[str, ...]]):
+        self._keywords = keywords
+
+        try:
+            import ahocorasick
+        except ImportError:
+            ahocorasick = None
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, categories in keywords.items():
+                self._automaton.add_word(keyword, (keyword, categories))
+            self._automaton.make_automaton()
+            self._pattern = None
+        else:
+            self._automaton = None
+            # [^\W_] matches exactly what str.isalnum() accepts. The lookahead
+            # is zero-width so overlapping keywords are all reported; at each
+            # start it finds the longest keyword with a boundary after it
+            alternatives = "|".join(
+                re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+            )
+            self._pattern = re.compile(rf"(?<![^\W_])(?=({alternatives})(?![^\W_]))")
+            # Shorter keywords starting at the same place are its prefixes
+            self._prefixes = {
+                keyword: sorted(
+                    (other for other in keywords if keyword.startswith(other)),
+                    key=len,
+                    reverse=True,
+                )
+                for keyword in keywords
+            }
+
+    def iter(self, text: str) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """Yield ``(keyword, categories)`` for every keyword found in text.
+
+        Matches are ordered by where they end, longest first.
+        """
+        text = text.lower()
+        if not self._keywords:
+            return
+
+        if self._pattern is not None:
+            found = []
+            for match in self._pattern.finditer(text):
+                start = match.start()
+                for keyword in self._prefixes[match.group(1)]:
+                    end = start + len(keyword)
+                    if end == len(text) or not text[end].isalnum():
+                        found.append((end, -len(keyword), keyword))
+            for _, _, keyword in sorted(found):
+                yield keyword, self._keywords[keyword]
+            return
+
+        for end, (keyword, categories) in self._automaton.iter(text):
+            start = end - len(keyword) + 1
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+            yield keyword, categories
+
+
+class CategorizationConfig(_ConfigModel):
     """Categorization rules configuration."""
     languages: Dict[str, List[str]] = Field(default_factory=lambda: {
         "Web Development": ["JavaScript", "TypeScript", "HTML", "CSS", "PHP", "Ruby"],
@@ -174,15 +274,49 @@ class CategorizationConfig(BaseModel):
         "Documentation": ["docs", "documentation", "wiki", "guide"],
     })
 
-
-class TemplateVariables(BaseModel):
+    @functools.cached_property
+    def language_categories(self) -> Dict[str, Tuple[str, ...]]:
+        """Categories keyed by lower-cased language name."""
+        index: Dict[str, List[str]] = {}
+        for category, languages in self.languages.items():
+            for language in languages:
+                index.setdefault(language.lower(), []).append(category)
+        return {language: tuple(categories) for language, categories in index.items()}
+
+    @functools.cached_property
+    def keyword_automaton(self) -> KeywordAutomaton:
+        """Matcher over topic and custom-rule keywords, built once."""
+        index: Dict[str, List[str]] = {}
+        for rules in (self.topics, self.custom_rules):
+            for category, keywords in rules.items():
+                for keyword in keywords:
+                    categories = index.setdefault(keyword.lower(), [])
+                    if category not in categories:
+                        categories.append(category)
+        return KeywordAutomaton(
+            {keyword: tuple(categories) for keyword, categories in index.items()}
+        )
+
+    def match_categories(self, language: Optional[str], text: str) -> List[str]:
+        """Categories matching a repository's language and descriptive text.
+
+        Languages are matched exactly; topic and custom-rule keywords are
+        searched for in text (e.g. name, description and topics).
+        """
+        matched = dict.fromkeys(self.language_categories.get((language or "").lower(), ()))
+        for _, categories in self.keyword_automaton.iter(text):
+            matched.update(dict.fromkeys(categories))
+        return list(matched)
+
+
+class TemplateVariables(_ConfigModel):
     """Template variables configuration."""
     author: str = "Reading List Generator"
     generated_date: str = "{{ now }}"
     total_repositories: str = "{{ stats.total_repos }}"
 
 
-class TemplateConfig(BaseModel):
+class TemplateConfig(_ConfigModel):
     """Template configuration."""
     directory: str = "templates"
     readme: str = "README_template.md"
@@ -203,11 +337,13 @@ class Config(BaseSettings):
     categorization: CategorizationConfig = Field(default_factory=CategorizationConfig)
     templates: TemplateConfig = Field(default_factory=TemplateConfig)
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        env_nested_delimiter = "__"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+        defer_build=True,
+    )
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -217,21 +353,27 @@ class Config(BaseSettings):
     def _load_env_vars(self):
         """Load environment variables into configuration."""
         # GitHub token
-        if github_token := os.getenv("GITHUB_TOKEN"):
+        if github_token := _ENV["GITHUB_TOKEN"]:
             self.github.token = github_token
 
         # GitHub username
-        if github_username := os.getenv("GITHUB_USERNAME"):
+        if github_username := _ENV["GITHUB_USERNAME"]:
             self.github.username = github_username
 
         # OpenAI API key
-        if openai_key := os.getenv("OPENAI_API_KEY"):
+        if openai_key := _ENV["OPENAI_API_KEY"]:
             self.ai.openai.api_key = openai_key
 
         # Anthropic API key
-        if anthropic_key := os.getenv("ANTHROPIC_API_KEY"):
+        if anthropic_key := _ENV["ANTHROPIC_API_KEY"]:
             self.ai.anthropic.api_key = anthropic_key
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Re-read environment overrides and drop the default dump built from the old ones."""
+        _ENV.update({name: os.environ.get(name) for name in _ENV_VARS})
+        _default_config_dump.cache_clear()
+
     def validate_required_settings(self) -> List[str]:
         """Validate required settings and return list of missing items."""
         missing = []
@@ -254,34 +396,48 @@ class Config(BaseSettings):
 
     def create_directories(self):
         """Create necessary directories."""
-        directories = [
-            Path(self.output.data_dir),
-            Path(self.output.data_dir) / "cache",
-            Path(self.output.data_dir) / "exports",
-            Path(self.output.data_dir) / "logs",
-            Path(self.templates.directory),
-        ]
+        # makedirs creates data_dir itself as the parent of each subdirectory
+        for subdirectory in DATA_SUBDIRECTORIES:
+            os.makedirs(os.path.join(self.output.data_dir, subdirectory), exist_ok=True)
+        os.makedirs(self.templates.directory, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path_str: str, file_key: Optional[Tuple[int, int]]) -> Dict:
+    """Parse a configuration file.
+
+    Cached per resolved path, modification time and size, so an edited
+    file is reparsed while repeated loads of an unchanged file skip YAML
+    parsing. Callers must not mutate the returned dict.
+    """
+    if file_key is None:
+        return {}
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
-    """Load configuration from file and environment variables."""
-    config_data = {}
+    """Load configuration from file and environment variables.
 
+    Each call returns a new Config, so callers may modify it freely.
+    """
     # Load from YAML file if exists
     if config_path is None:
         config_path = Path("config.yaml")
     else:
         config_path = Path(config_path)
 
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f) or {}
+    config_path = config_path.resolve()
+    try:
+        stat = config_path.stat()
+        # Size catches edits within one tick of a coarse-grained mtime
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
 
     # Create config instance
-    config = Config(**config_data)
+    config = Config(**_read_config_file(str(config_path), file_key))
 
     # Validate required settings
     missing = config.validate_required_settings()
@@ -294,16 +450,24 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     return config
 
 
+@functools.lru_cache(maxsize=1)
+def _default_config_dump() -> Dict:
+    """Serialized default configuration, computed once per process."""
+    return Config().model_dump(mode="json", exclude_none=True)
+
+
 def create_default_config(output_path: Union[str, Path] = "config.yaml") -> None:
     """Create a default configuration file."""
-    config = Config()
     output_path = Path(output_path)
 
-    # Convert to dict and save as YAML
-    config_dict = config.dict()
-
     with open(output_path, "w") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+        yaml.dump(
+            _default_config_dump(),
+            f,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            indent=2,
+        )
 
     print(f"Default configuration created at: {output_path}")
 
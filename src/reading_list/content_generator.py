@@ -1,20 +1,89 @@
 """Content generator module for GitHub Reading List Generator."""
 
-# Placeholder for content generation functionality
-# This will be implemented in future iterations
+from datetime import datetime
+from pathlib import Path
+from typing import IO, List, Optional, Union
+
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    PackageLoader,
+    select_autoescape,
+)
+
+# Built-in templates shipped in reading_list/templates, used when the
+# configured templates directory does not provide its own
+DEFAULT_README_TEMPLATE = "readme.md.j2"
+DEFAULT_HTML_REPORT_TEMPLATE = "report.html.j2"
+
 
 class ContentGenerator:
     """Content generator for README and other files."""
-    
+
     def __init__(self, config):
         self.config = config
-    
-    def generate_readme(self, repositories, analysis_results):
-        """Generate README content."""
-        # Placeholder implementation
-        return "# Generated README\n\nContent will be generated here."
-    
-    def generate_html_report(self, repositories, analysis_results):
-        """Generate HTML report."""
-        # Placeholder implementation
-        return "<html><body><h1>Generated Report</h1></body></html>" 
\ No newline at end of file
+
+        # Compiled templates are cached on disk so each template is parsed once
+        cache_dir = Path(config.output.data_dir) / "cache" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.env = Environment(
+            loader=ChoiceLoader([
+                FileSystemLoader(config.templates.directory),
+                PackageLoader("reading_list", "templates"),
+            ]),
+            bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+            autoescape=select_autoescape(["html", "htm", "xml", "html.j2"]),
+            keep_trailing_newline=True,
+            auto_reload=False,
+        )
+
+    def _render(
+        self,
+        template_names: List[str],
+        output: Optional[Union[str, Path, IO]],
+        **context,
+    ) -> Optional[str]:
+        """Render the first available template, streaming it to output if given."""
+        template = self.env.select_template(template_names)
+        context.setdefault("now", datetime.now())
+
+        if output is None:
+            return template.render(**context)
+
+        stream = template.stream(**context)
+        if isinstance(output, (str, Path)):
+            stream.dump(str(output), encoding="utf-8")
+        else:
+            stream.dump(output)
+        return None
+
+    def generate_readme(
+        self,
+        repositories,
+        analysis_results,
+        output: Optional[Union[str, Path, IO]] = None,
+    ) -> Optional[str]:
+        """Generate README content, or stream it to output if given."""
+        return self._render(
+            [self.config.templates.readme, DEFAULT_README_TEMPLATE],
+            output,
+            repositories=repositories,
+            analysis=analysis_results,
+        )
+
+    def generate_html_report(
+        self,
+        repositories,
+        analysis_results,
+        output: Optional[Union[str, Path, IO]] = None,
+    ) -> Optional[str]:
+        """Generate HTML report, or stream it to output if given."""
+        return self._render(
+            [self.config.templates.html_report, DEFAULT_HTML_REPORT_TEMPLATE],
+            output,
+            repositories=repositories,
+            analysis=analysis_results,
+        )
@@ -1,22 +1,58 @@
 """GitHub API client for Reading List Generator."""
 
 import asyncio
+import functools
+import importlib.util
 import logging
-from dataclasses import dataclass, field
+import re
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import AsyncIterator, Dict, List, Optional, Union
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple, Union
 
-import aiohttp
+import httpx
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .cache import CacheStore
 from .config import GitHubConfig
+from .rate_limit import respect_reset
 
 logger = logging.getLogger(__name__)
 
+# Page number of the rel="last" target in a GitHub Link header
+LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
 
-@dataclass
+# Starred repositories with only the fields Repository uses
+STARRED_QUERY = """
+query($login: String!, $first: Int!, $cursor: String) {
+  user(login: $login) {
+    starredRepositories(first: $first, after: $cursor,
+                        orderBy: {field: STARRED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        databaseId name nameWithOwner description url stargazerCount
+        primaryLanguage { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        createdAt updatedAt pushedAt
+        isArchived isDisabled isPrivate isFork forkCount diskUsage
+        issues(states: OPEN) { totalCount }
+        licenseInfo { key name spdx_id: spdxId url }
+        defaultBranchRef { name }
+      }
+    }
+  }
+}
+"""
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(slots=True)
 class Repository:
     """GitHub repository representation."""
     id: int
@@ -45,60 +81,48 @@ class Repository:
 
     def dict(self) -> Dict:
         """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "full_name": self.full_name,
-            "description": self.description,
-            "html_url": self.html_url,
-            "stargazers_count": self.stargazers_count,
-            "language": self.language,
-            "topics": self.topics,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "pushed_at": self.pushed_at,
-            "size": self.size,
-            "default_branch": self.default_branch,
-            "archived": self.archived,
-            "disabled": self.disabled,
-            "private": self.private,
-            "fork": self.fork,
-            "license": self.license,
-            "open_issues_count": self.open_issues_count,
-            "forks_count": self.forks_count,
-            "watchers_count": self.watchers_count,
-            "network_count": self.network_count,
-            "subscribers_count": self.subscribers_count,
-        }
+        return {name: getattr(self, name) for name in _FIELDS}
 
     @classmethod
     def from_api_response(cls, data: Dict) -> "Repository":
         """Create Repository from GitHub API response."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            full_name=data["full_name"],
-            description=data.get("description"),
-            html_url=data["html_url"],
-            stargazers_count=data["stargazers_count"],
-            language=data.get("language"),
-            topics=data.get("topics", []),
-            created_at=cls._parse_datetime(data.get("created_at")),
-            updated_at=cls._parse_datetime(data.get("updated_at")),
-            pushed_at=cls._parse_datetime(data.get("pushed_at")),
-            size=data.get("size", 0),
-            default_branch=data.get("default_branch", "main"),
-            archived=data.get("archived", False),
-            disabled=data.get("disabled", False),
-            private=data.get("private", False),
-            fork=data.get("fork", False),
-            license=data.get("license"),
-            open_issues_count=data.get("open_issues_count", 0),
-            forks_count=data.get("forks_count", 0),
-            watchers_count=data.get("watchers_count", 0),
-            network_count=data.get("network_count", 0),
-            subscribers_count=data.get("subscribers_count", 0),
-        )
+        kwargs = {name: data[name] for name in _FIELDS if name in data}
+        for name in _DATETIME_FIELDS:
+            kwargs[name] = cls._parse_datetime(data.get(name))
+        kwargs.setdefault("description", None)
+        kwargs.setdefault("language", None)
+        return cls(**kwargs)
+
+    @classmethod
+    def from_graphql_node(cls, node: Dict) -> "Repository":
+        """Create Repository from a GraphQL starredRepositories node."""
+        language = node.get("primaryLanguage") or {}
+        branch = node.get("defaultBranchRef") or {}
+        topics = (node.get("repositoryTopics") or {}).get("nodes", [])
+        return cls.from_api_response({
+            "id": node["databaseId"],
+            "name": node["name"],
+            "full_name": node["nameWithOwner"],
+            "description": node.get("description"),
+            "html_url": node["url"],
+            "stargazers_count": node["stargazerCount"],
+            # The REST API reports stargazers as watchers_count too
+            "watchers_count": node["stargazerCount"],
+            "language": language.get("name"),
+            "topics": [t["topic"]["name"] for t in topics],
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "pushed_at": node.get("pushedAt"),
+            "size": node.get("diskUsage") or 0,
+            "default_branch": branch.get("name", "main"),
+            "archived": node.get("isArchived", False),
+            "disabled": node.get("isDisabled", False),
+            "private": node.get("isPrivate", False),
+            "fork": node.get("isFork", False),
+            "license": node.get("licenseInfo"),
+            "forks_count": node.get("forkCount", 0),
+            "open_issues_count": (node.get("issues") or {}).get("totalCount", 0),
+        })
 
     @staticmethod
     def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
@@ -106,11 +130,51 @@ class Repository:
         if not date_str:
             return None
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            return _parse_dt_cached(date_str)
+        except (ValueError, TypeError):
             return None
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_dt_cached(date_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp; many repositories share timestamps."""
+    # Python 3.11+ accepts the trailing "Z" GitHub uses for UTC
+    return datetime.fromisoformat(date_str)
+
+
+@functools.lru_cache(maxsize=None)
+def _page_decoder():
+    """Typed msgspec decoder for a page of repositories, if msgspec is installed."""
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec.json.Decoder(List[Repository])
+
+
+def decode_repositories(content: bytes) -> List[Repository]:
+    """Decode a JSON page of REST repository objects.
+    
+    With msgspec installed (the "speed" extra) the page is decoded and
+    validated straight into Repository instances in C; otherwise, or when
+    a payload does not match the declared field types, it is parsed with
+    orjson and mapped through Repository.from_api_response.
+    """
+    decoder = _page_decoder()
+    if decoder is not None:
+        try:
+            return decoder.decode(content)
+        except ValueError:
+            # msgspec.ValidationError, e.g. a field GitHub left out
+            pass
+    return [Repository.from_api_response(data) for data in orjson.loads(content)]
+
+
+# Field names in declaration order, shared by dict() and from_api_response()
+_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(Repository))
+_DATETIME_FIELDS = frozenset({"created_at", "updated_at", "pushed_at"})
+
+
 class GitHubAPIError(Exception):
     """GitHub API error."""
     
@@ -130,9 +194,24 @@ class RateLimitError(GitHubAPIError):
 class GitHubClient:
     """GitHub API client with rate limiting and caching."""
     
-    def __init__(self, config: GitHubConfig):
+    def __init__(
+        self,
+        config: GitHubConfig,
+        cache_dir: Optional[Union[str, Path]] = None,
+        request_delay: float = 0.0,
+        max_concurrent_requests: int = 8,
+    ):
         self.config = config
+        self.request_delay = request_delay
+        # Concurrent page fetches; kept low for GitHub's secondary rate limits
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
         self.session = self._create_session()
+        # Created lazily so it binds to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Conditional-request cache of ETag/Last-Modified and response bodies
+        self.cache = (
+            CacheStore(cache_dir) if cache_dir is not None and config.enable_cache else None
+        )
         self._rate_limit_remaining = config.rate_limit
         self._rate_limit_reset = 0
         
@@ -142,14 +221,26 @@ class GitHubClient:
         """Create requests session with retry strategy."""
         session = requests.Session()
         
-        # Retry strategy
+        # Retry strategy for server errors; rate limits are retried by
+        # _make_request, which waits for the advertised reset instead.
+        # urllib3 would otherwise retry any 429 carrying Retry-After
+        # itself, multiplying the attempts _make_request makes
         retry_strategy = Retry(
             total=self.config.retry_attempts,
             backoff_factor=self.config.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=False,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # All traffic goes to one host, so keep a single pool with enough
+        # keep-alive connections that concurrent callers never discard them
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -173,27 +264,108 @@ class GitHubClient:
         if response.status_code == 403 and "rate limit" in response.text.lower():
             raise RateLimitError(self._rate_limit_reset)
     
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+    ) -> Tuple[Optional[str], Optional[Dict], Dict[str, str]]:
+        """Find the cached response for a GET request.
+        
+        Returns the cache key, the cached entry and the conditional headers
+        (If-None-Match / If-Modified-Since) to send with the request.
+        """
+        if self.cache is None or method.upper() != "GET":
+            return None, None, {}
+        
+        key = CacheStore.make_key("GET", url, sorted((params or {}).items()))
+        entry = self.cache.get(key)
+        
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        return key, entry, headers
+    
+    def _cache_store(
+        self,
+        key: Optional[str],
+        headers: Mapping[str, str],
+        body: Union[Dict, List, None] = None,
+        raw: Optional[str] = None,
+    ) -> None:
+        """Cache a response along with its validators.
+        
+        Either the decoded body or the raw JSON text is stored; raw text
+        spares re-encoding responses that are decoded by the caller.
+        """
+        if self.cache is None or key is None:
+            return
+        
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            entry = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "link": headers.get("Link"),
+            }
+            if raw is not None:
+                entry["raw"] = raw
+            else:
+                entry["body"] = body
+            self.cache.set(key, entry)
+    
     def _make_request(
         self, 
         method: str, 
         url: str, 
         **kwargs
     ) -> Union[Dict, List]:
-        """Make HTTP request with error handling."""
+        """Make HTTP request with error handling.
+        
+        GET responses are revalidated with the cached ETag/Last-Modified;
+        a 304 Not Modified returns the cached body. Rate-limited responses
+        are retried after the Retry-After / X-RateLimit-Reset wait.
+        """
         full_url = f"{self.config.base_url.rstrip('/')}/{url.lstrip('/')}"
         
+        cache_key, cached, conditional_headers = self._cache_lookup(
+            method, full_url, kwargs.get("params")
+        )
+        if conditional_headers:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **conditional_headers}
+        
         try:
-            response = self.session.request(
-                method,
-                full_url,
-                timeout=self.config.timeout,
-                **kwargs
-            )
+            for attempt in range(self.config.retry_attempts + 1):
+                response = self.session.request(
+                    method,
+                    full_url,
+                    timeout=self.config.timeout,
+                    **kwargs
+                )
+                
+                wait = respect_reset(response.status_code, response.headers, attempt)
+                if wait is None or attempt == self.config.retry_attempts:
+                    break
+                
+                logger.warning(f"Rate limited on {url}, retrying in {wait:.1f}s")
+                time.sleep(wait)
             
             self._check_rate_limit(response)
             
-            if response.status_code == 200:
-                return response.json()
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Not modified, using cached response: {url}")
+                if "raw" in cached:
+                    return orjson.loads(cached["raw"])
+                return cached["body"]
+            elif response.status_code == 200:
+                data = orjson.loads(response.content)
+                self._cache_store(cache_key, response.headers, data)
+                return data
             elif response.status_code == 404:
                 raise GitHubAPIError(f"Resource not found: {url}", 404)
             elif response.status_code == 401:
@@ -203,6 +375,8 @@ class GitHubClient:
                     raise RateLimitError(self._rate_limit_reset)
                 else:
                     raise GitHubAPIError(f"Access forbidden: {response.text}", 403)
+            elif response.status_code == 429:
+                raise RateLimitError(self._rate_limit_reset)
             else:
                 raise GitHubAPIError(
                     f"API request failed with status {response.status_code}: {response.text}",
@@ -215,6 +389,8 @@ class GitHubClient:
             raise GitHubAPIError("Connection error - check your internet connection")
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(f"Request failed: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            raise GitHubAPIError(f"Invalid JSON response: {str(e)}")
     
     def get_starred_repositories_sync(
         self, 
@@ -255,9 +431,8 @@ class GitHubClient:
                 page += 1
                 
                 # Add delay to respect rate limits
-                if self.config.request_delay > 0:
-                    import time
-                    time.sleep(self.config.request_delay)
+                if self.request_delay > 0:
+                    time.sleep(self.request_delay)
                 
             except RateLimitError as e:
                 logger.warning(f"Rate limit exceeded. Reset time: {e.reset_time}")
@@ -269,72 +444,254 @@ class GitHubClient:
         logger.info(f"Total repositories fetched: {len(repositories)}")
         return repositories
     
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+        
+        Requests are multiplexed over HTTP/2 when h2 is installed, and
+        responses are gzip-compressed by default.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                headers={
+                    "Authorization": f"token {self.config.token}",
+                    "Accept": "application/vnd.github.v3+json",
+                    "User-Agent": "GitHub-Reading-List-Generator/1.0",
+                },
+                http2=HTTP2_AVAILABLE,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """Close the shared httpx client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a request, retrying rate-limited responses after their reset."""
+        try:
+            for attempt in range(self.config.retry_attempts + 1):
+                response = await client.request(method, url, **kwargs)
+                
+                wait = respect_reset(response.status_code, response.headers, attempt)
+                if wait is None or attempt == self.config.retry_attempts:
+                    return response
+                
+                logger.warning(f"Rate limited on {url}, retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+        
+        except httpx.TimeoutException:
+            raise GitHubAPIError(f"Request timeout after {self.config.timeout} seconds")
+        except httpx.HTTPError as e:
+            raise GitHubAPIError(f"Request failed: {str(e)}")
+    
+    @staticmethod
+    def _raise_for_error(response: httpx.Response) -> None:
+        """Map an unsuccessful response to GitHubAPIError."""
+        if response.status_code == 401:
+            raise GitHubAPIError("Authentication failed - check your token", 401)
+        elif response.status_code in (403, 429):
+            reset = response.headers.get("X-RateLimit-Reset")
+            raise RateLimitError(int(reset) if reset and reset.isdigit() else None)
+        else:
+            raise GitHubAPIError(
+                f"API request failed with status {response.status_code}: {response.text}",
+                response.status_code
+            )
+    
+    def _graphql_url(self) -> str:
+        """GraphQL endpoint for base_url (GitHub Enterprise uses /api/graphql)."""
+        base_url = self.config.base_url.rstrip("/")
+        if base_url.endswith("/api/v3"):
+            return base_url[:-len("/v3")] + "/graphql"
+        return f"{base_url}/graphql"
+    
+    async def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Run a GraphQL query and return its data."""
+        client = await self._get_async_client()
+        response = await self._send(
+            client,
+            "POST",
+            self._graphql_url(),
+            content=orjson.dumps({"query": query, "variables": variables or {}}),
+            headers={"Content-Type": "application/json"},
+        )
+        
+        if response.status_code != 200:
+            self._raise_for_error(response)
+        
+        try:
+            body = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise GitHubAPIError(f"Invalid JSON response: {str(e)}")
+        
+        if body.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in body["errors"])
+            raise GitHubAPIError(f"GraphQL query failed: {messages}")
+        return body["data"]
+    
+    async def _get_starred_repositories_graphql(
+        self,
+        username: str,
+        per_page: int = 100,
+    ) -> AsyncIterator[Repository]:
+        """Get starred repositories through the GraphQL API."""
+        cursor = None
+        page = 1
+        
+        while True:
+            data = await self.graphql(STARRED_QUERY, {
+                "login": username,
+                "first": min(per_page, 100),
+                "cursor": cursor,
+            })
+            
+            if data.get("user") is None:
+                raise GitHubAPIError(f"User not found: {username}", 404)
+            
+            starred = data["user"]["starredRepositories"]
+            logger.info(f"Fetched {len(starred['nodes'])} repositories from page {page}")
+            for node in starred["nodes"]:
+                yield Repository.from_graphql_node(node)
+            
+            if not starred["pageInfo"]["hasNextPage"]:
+                break
+            
+            cursor = starred["pageInfo"]["endCursor"]
+            page += 1
+            
+            # Add delay to respect rate limits
+            if self.request_delay > 0:
+                await asyncio.sleep(self.request_delay)
+    
+    @staticmethod
+    def _last_page(link_header: Optional[str]) -> Optional[int]:
+        """Extract the rel="last" page number from a Link header."""
+        if not link_header:
+            return None
+        match = LAST_PAGE_PATTERN.search(link_header)
+        return int(match.group(1)) if match else None
+    
+    async def _fetch_starred_page(
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        page: int,
+        per_page: int,
+    ) -> Tuple[List[Repository], Optional[str]]:
+        """Fetch one page of starred repositories and its Link header."""
+        path = f"users/{username}/starred"
+        params = {
+            "per_page": per_page,
+            "page": page,
+            "sort": "updated",
+            "direction": "desc",
+        }
+        
+        cache_key, cached, conditional_headers = self._cache_lookup(
+            "GET", f"{self.config.base_url}/{path}", params
+        )
+        
+        response = await self._send(
+            client, "GET", path, params=params, headers=conditional_headers
+        )
+        
+        try:
+            if response.status_code == 304 and cached is not None:
+                if "raw" in cached:
+                    repos = decode_repositories(cached["raw"].encode("utf-8"))
+                else:
+                    repos = [Repository.from_api_response(data) for data in cached["body"]]
+                link = response.headers.get("Link") or cached.get("link")
+            elif response.status_code == 200:
+                repos = decode_repositories(response.content)
+                link = response.headers.get("Link")
+                # Keep the page undecoded; it is decoded again only on a 304
+                self._cache_store(cache_key, response.headers, raw=response.text)
+            elif response.status_code == 404:
+                raise GitHubAPIError(f"User not found: {username}", 404)
+            else:
+                self._raise_for_error(response)
+        except orjson.JSONDecodeError as e:
+            raise GitHubAPIError(f"Invalid JSON response: {str(e)}")
+        
+        logger.info(f"Fetched {len(repos)} repositories from page {page}")
+        
+        # Add delay to respect rate limits
+        if self.request_delay > 0:
+            await asyncio.sleep(self.request_delay)
+        
+        return repos, link
+    
     async def get_starred_repositories(
         self, 
         username: str, 
         per_page: int = 100
     ) -> AsyncIterator[Repository]:
-        """Get starred repositories asynchronously."""
-        page = 1
+        """Get starred repositories asynchronously.
         
-        async with aiohttp.ClientSession(
-            headers={
-                "Authorization": f"token {self.config.token}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "GitHub-Reading-List-Generator/1.0",
-            },
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-        ) as session:
-            
-            while True:
-                url = f"{self.config.base_url}/users/{username}/starred"
-                params = {
-                    "per_page": per_page,
-                    "page": page,
-                    "sort": "updated",
-                    "direction": "desc",
-                }
-                
-                try:
-                    async with session.get(url, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            if not data:
-                                break
-                            
-                            for repo_data in data:
-                                yield Repository.from_api_response(repo_data)
-                            
-                            logger.info(f"Fetched {len(data)} repositories from page {page}")
-                            
-                            # If we got fewer repos than requested, we're done
-                            if len(data) < per_page:
-                                break
-                            
-                            page += 1
-                            
-                            # Add delay to respect rate limits
-                            if self.config.request_delay > 0:
-                                await asyncio.sleep(self.config.request_delay)
-                        
-                        elif response.status == 404:
-                            raise GitHubAPIError(f"User not found: {username}", 404)
-                        elif response.status == 401:
-                            raise GitHubAPIError("Authentication failed - check your token", 401)
-                        elif response.status == 403:
-                            raise RateLimitError()
-                        else:
-                            error_text = await response.text()
-                            raise GitHubAPIError(
-                                f"API request failed with status {response.status}: {error_text}",
-                                response.status
-                            )
-                
-                except aiohttp.ClientTimeout:
-                    raise GitHubAPIError(f"Request timeout after {self.config.timeout} seconds")
-                except aiohttp.ClientError as e:
-                    raise GitHubAPIError(f"Request failed: {str(e)}")
+        The first page reports the page count in its Link rel="last"
+        header; the remaining pages are then fetched concurrently, bounded
+        by max_concurrent_requests, and yielded in page order.
+        
+        With github.use_graphql and a token, the GraphQL API is used
+        instead, fetching only the fields Repository needs.
+        """
+        if self.config.use_graphql and self.config.token:
+            async for repo in self._get_starred_repositories_graphql(username, per_page):
+                yield repo
+            return
+        
+        client = await self._get_async_client()
+        
+        repos, link = await self._fetch_starred_page(client, username, 1, per_page)
+        for repo in repos:
+            yield repo
+        
+        last_page = self._last_page(link)
+        
+        if last_page is None:
+            # No page count advertised; walk pages until a short one
+            page = 1
+            while len(repos) == per_page:
+                page += 1
+                repos, _ = await self._fetch_starred_page(client, username, page, per_page)
+                for repo in repos:
+                    yield repo
+            return
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def fetch_page(page: int) -> List[Repository]:
+            async with semaphore:
+                page_repos, _ = await self._fetch_starred_page(
+                    client, username, page, per_page
+                )
+                return page_repos
+        
+        tasks = [
+            asyncio.create_task(fetch_page(page))
+            for page in range(2, last_page + 1)
+        ]
+        
+        try:
+            # Yield each page as soon as it and all earlier pages are done
+            for task in tasks:
+                for repo in await task:
+                    yield repo
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     def get_repository_content(
         self, 
@@ -397,4 +754,13 @@ class GitHubClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        self.session.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
         self.session.close() 
\ No newline at end of file
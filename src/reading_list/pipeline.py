@@ -2,13 +2,35 @@
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
+import aiofiles
+import orjson
+
+from .ai_analyzer import AIAnalyzer
+from .cache import CacheStore
 from .config import Config
+from .content_generator import ContentGenerator
 from .github_client import GitHubClient, Repository
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,13 +67,56 @@ class Pipeline:
     
     def __init__(self, config: Config):
         self.config = config
-        self.github_client = GitHubClient(config.github)
+        self.github_client = GitHubClient(
+            config.github,
+            cache_dir=Path(config.output.data_dir) / "cache" / "github",
+            request_delay=config.performance.request_delay,
+            max_concurrent_requests=config.performance.max_concurrent_requests,
+        )
+        
+        # README and HTML report are rendered from Jinja2 templates
+        self.content_generator = ContentGenerator(config)
+        
+        # Batched, concurrent categorization through the configured AI provider
+        self.ai_analyzer = AIAnalyzer(config)
         
         # Setup logging
         self._setup_logging()
         
+        # Inside "async with" the HTTP session outlives individual calls
+        self._in_context = False
+        
+        # Fetched repositories as (cache key, fetched_at, repositories),
+        # reused for github.cache_ttl seconds; persisted so separate CLI
+        # runs share it
+        self._repo_cache: Optional[Tuple[str, float, List[Repository]]] = None
+        self._repo_store = (
+            CacheStore(Path(config.output.data_dir) / "cache" / "pipeline")
+            if config.github.enable_cache
+            else None
+        )
+        
         logger.info("Pipeline initialized")
     
+    async def __aenter__(self):
+        """Async context manager entry; keeps the HTTP session open."""
+        self._in_context = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self._in_context = False
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the GitHub client."""
+        await self.github_client.aclose()
+    
+    async def _release_client(self) -> None:
+        """Close the HTTP session unless an "async with" block owns it."""
+        if not self._in_context:
+            await self.aclose()
+    
     def _setup_logging(self):
         """Setup logging configuration."""
         logging.basicConfig(
@@ -62,25 +127,39 @@ class Pipeline:
     async def run(
         self, 
         force_refresh: bool = False, 
-        skip_ai: bool = False
+        skip_ai: bool = False,
+        repositories: Optional[List[Repository]] = None,
     ) -> ProcessingResult:
-        """Run the complete pipeline."""
+        """Run the complete pipeline.
+        
+        Pre-fetched repositories may be passed in, in which case GitHub is
+        not queried at all.
+        """
         logger.info("Starting pipeline execution")
         
         try:
-            # Step 1: Fetch repositories
-            logger.info("Fetching starred repositories from GitHub")
-            repositories = await self._fetch_repositories()
-            logger.info(f"Found {len(repositories)} starred repositories")
+            # Step 1: Fetch repositories, and AI Analysis (if enabled and not skipped)
+            if repositories is None:
+                logger.info("Fetching starred repositories from GitHub")
             
-            # Step 2: AI Analysis (if enabled and not skipped)
             if self.config.features.enable_ai_analysis and not skip_ai:
+                if repositories is None:
+                    repositories = await self._fetch_repositories(force_refresh)
+                logger.info(f"Found {len(repositories)} starred repositories")
+                
                 logger.info("Analyzing repositories with AI")
                 analysis_result = await self._analyze_repositories(repositories)
                 logger.info("AI analysis completed")
             else:
                 logger.info("Skipping AI analysis")
-                analysis_result = self._create_basic_analysis(repositories)
+                if repositories is None:
+                    # Repositories are grouped while later pages are still in flight
+                    repositories, analysis_result = await self._stream_basic_analysis(
+                        self._iter_repositories(force_refresh)
+                    )
+                else:
+                    analysis_result = self._create_basic_analysis(repositories)
+                logger.info(f"Found {len(repositories)} starred repositories")
             
             # Step 3: Generate visualizations (if enabled)
             visualizations_count = 0
@@ -109,43 +188,141 @@ class Pipeline:
         except Exception as e:
             logger.error(f"Pipeline execution failed: {e}")
             raise
+        
+        finally:
+            await self._release_client()
+    
+    async def _write_output(self, path: Path, data: Union[bytes, memoryview]) -> None:
+        """Write data to path in one call without blocking the event loop."""
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+    
+    def _cached_repositories(self) -> Optional[List[Repository]]:
+        """Return repositories fetched within github.cache_ttl, if any."""
+        ttl = self.config.github.cache_ttl
+        key = self._repo_cache_key()
+        
+        if self._repo_cache:
+            cached_key, fetched_at, repositories = self._repo_cache
+            if cached_key == key and time.time() - fetched_at < ttl:
+                return repositories
+        
+        if self._repo_store is None:
+            return None
+        
+        entry = self._repo_store.get(key)
+        if not entry or time.time() - entry.get("fetched_at", 0) >= ttl:
+            return None
+        
+        repositories = [
+            Repository.from_api_response(data) for data in entry["repositories"]
+        ]
+        self._repo_cache = (key, entry["fetched_at"], repositories)
+        logger.info(f"Using {len(repositories)} cached repositories")
+        return repositories
     
-    async def _fetch_repositories(self) -> List[Repository]:
-        """Fetch starred repositories from GitHub."""
+    def _repo_cache_key(self) -> str:
+        """Cache key for the configured user's starred repositories.
+        
+        The host and API are part of the key, so switching to GitHub
+        Enterprise or to GraphQL never reuses the other's list.
+        """
+        github = self.config.github
+        return CacheStore.make_key(
+            "starred", github.base_url, github.use_graphql, github.username
+        )
+    
+    async def _iter_repositories(
+        self, force_refresh: bool = False
+    ) -> AsyncIterator[Repository]:
+        """Yield starred repositories as they are fetched from GitHub.
+        
+        Results are reused for github.cache_ttl seconds unless
+        force_refresh is set.
+        """
+        if not force_refresh:
+            cached = self._cached_repositories()
+            if cached is not None:
+                for repo in cached:
+                    yield repo
+                return
+        
         repositories = []
         
         async for repo in self.github_client.get_starred_repositories(
             self.config.github.username
         ):
             repositories.append(repo)
+            yield repo
             
             # Log progress every 50 repositories
             if len(repositories) % 50 == 0:
                 logger.info(f"Fetched {len(repositories)} repositories so far...")
         
-        return repositories
+        fetched_at = time.time()
+        key = self._repo_cache_key()
+        self._repo_cache = (key, fetched_at, repositories)
+        if self._repo_store is not None:
+            self._repo_store.set(key, {
+                "fetched_at": fetched_at,
+                "repositories": repositories,
+            })
+    
+    async def _fetch_repositories(self, force_refresh: bool = False) -> List[Repository]:
+        """Fetch all starred repositories from GitHub."""
+        return [repo async for repo in self._iter_repositories(force_refresh)]
     
     def _create_basic_analysis(self, repositories: List[Repository]) -> dict:
         """Create basic analysis without AI."""
         # Simple categorization by language
-        categories = {}
+        categories = defaultdict(list)
         for repo in repositories:
-            language = repo.language or "Unknown"
-            if language not in categories:
-                categories[language] = []
-            categories[language].append(repo)
+            categories[repo.language or "Unknown"].append(repo)
         
+        return self._basic_analysis_result(categories, len(repositories))
+    
+    async def _stream_basic_analysis(
+        self, repo_iter: AsyncIterator[Repository]
+    ) -> Tuple[List[Repository], dict]:
+        """Create basic analysis while repositories arrive from repo_iter."""
+        repositories = []
+        categories = defaultdict(list)
+        async for repo in repo_iter:
+            repositories.append(repo)
+            categories[repo.language or "Unknown"].append(repo)
+        
+        return repositories, self._basic_analysis_result(categories, len(repositories))
+    
+    @staticmethod
+    def _basic_analysis_result(categories: Dict[str, List[Repository]], total: int) -> dict:
+        """Build the basic analysis result from language buckets."""
         return {
-            "categories": categories,
-            "summary": f"Analyzed {len(repositories)} repositories",
+            "categories": dict(categories),
+            "summary": f"Analyzed {total} repositories",
             "method": "basic",
         }
     
     async def _analyze_repositories(self, repositories: List[Repository]) -> dict:
-        """Analyze repositories using AI (placeholder)."""
-        # This would integrate with AI providers
-        logger.info("AI analysis is not yet implemented - using basic analysis")
-        return self._create_basic_analysis(repositories)
+        """Categorize and summarize repositories with the configured AI provider.
+        
+        Repositories the provider cannot analyze keep their language as
+        category; without a usable provider the basic analysis is used.
+        """
+        if not self.ai_analyzer.provider_enabled():
+            logger.info("No AI provider API key configured - using basic analysis")
+            return self._create_basic_analysis(repositories)
+        
+        analyses = await self.ai_analyzer.analyze_repositories(repositories)
+        
+        categories = defaultdict(list)
+        summaries = {}
+        for repo, analysis in zip(repositories, analyses, strict=True):
+            categories[analysis["category"]].append(repo)
+            summaries[repo.full_name] = analysis["summary"]
+        
+        result = self._basic_analysis_result(categories, len(repositories))
+        result.update(method="ai", summaries=summaries)
+        return result
     
     async def _generate_visualizations(self, repositories: List[Repository]) -> int:
         """Generate visualizations (placeholder)."""
@@ -164,7 +341,7 @@ class Pipeline:
         # Generate basic README
         readme_content = self._generate_basic_readme(repositories, analysis_result)
         readme_path = Path(self.config.output.data_dir) / "README.md"
-        readme_path.write_text(readme_content)
+        await self._write_output(readme_path, readme_content.encode("utf-8"))
         export_count += 1
         
         logger.info(f"Generated README at {readme_path}")
@@ -177,41 +354,51 @@ class Pipeline:
         analysis_result: dict
     ) -> str:
         """Generate a basic README file."""
-        content = f"""# 📚 My GitHub Reading List
-
-Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 📊 Summary
-
-- **Total Repositories**: {len(repositories)}
-- **Categories**: {len(analysis_result.get('categories', {}))}
-
-## 📋 Repositories by Category
-
-"""
+        return self.content_generator.generate_readme(repositories, analysis_result)
+    
+    @staticmethod
+    def _parquet_schema() -> "pa.Schema":
+        """Arrow schema with one column per Repository field.
         
-        # Add repositories by category
-        categories = analysis_result.get("categories", {})
-        for category, repos in categories.items():
-            content += f"\n### {category} ({len(repos)} repositories)\n\n"
-            
-            for repo in repos[:10]:  # Limit to first 10 per category
-                stars = "⭐" * min(5, repo.stargazers_count // 1000)
-                content += f"- **[{repo.name}]({repo.html_url})**{stars}\n"
-                if repo.description:
-                    content += f"  {repo.description}\n"
-                content += f"  *{repo.stargazers_count:,} stars • {repo.language or 'Unknown'}*\n\n"
-            
-            if len(repos) > 10:
-                content += f"  ... and {len(repos) - 10} more repositories\n\n"
+        Column types come from the field annotations, so an empty export
+        or an all-null column is still written with its proper type.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ValueError(
+                "Parquet export requires pyarrow: pip install 'reading-list[parquet]'"
+            ) from e
         
-        content += f"""
----
-
-*Generated by [GitHub Reading List Generator](https://github.com/usathyan/reading-list)*
-"""
+        types = {
+            int: pa.int64(),
+            str: pa.string(),
+            bool: pa.bool_(),
+            datetime: pa.timestamp("us", tz="UTC"),
+            List[str]: pa.list_(pa.string()),
+            # GitHub's license object; keys such as node_id are not kept
+            Dict: pa.struct([
+                (key, pa.string()) for key in ("key", "name", "spdx_id", "url")
+            ]),
+        }
+        columns = []
+        for f in fields(Repository):
+            annotation = f.type
+            if get_origin(annotation) is Union:  # Optional[X]
+                (annotation,) = (a for a in get_args(annotation) if a is not type(None))
+            columns.append(pa.field(f.name, types[annotation]))
+        return pa.schema(columns)
+    
+    @staticmethod
+    def _write_parquet(repositories: List[Repository], output_path: Path) -> None:
+        """Write repositories as a typed, zstd-compressed Parquet table."""
+        schema = Pipeline._parquet_schema()
+        
+        import pyarrow as pa
+        import pyarrow.parquet as pq
         
-        return content
+        table = pa.Table.from_pylist([repo.dict() for repo in repositories], schema=schema)
+        pq.write_table(table, output_path, compression="zstd")
     
     async def export(
         self, 
@@ -220,81 +407,66 @@ Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         pretty_json: bool = False
     ) -> ExportResult:
         """Export data in specified format."""
+        try:
+            repositories = await self._fetch_repositories()
+            return await self._write_format(
+                format_type, output_path, repositories, pretty_json
+            )
+        finally:
+            await self._release_client()
+    
+    async def _write_format(
+        self, 
+        format_type: str, 
+        output_path: Path, 
+        repositories: List[Repository],
+        pretty_json: bool = False
+    ) -> ExportResult:
+        """Write repositories to output_path in the specified format."""
         logger.info(f"Exporting data to {format_type} format")
         
-        # Fetch repositories
-        repositories = await self._fetch_repositories()
-        
         if format_type == "json":
-            import json
-            
-            data = [repo.dict() for repo in repositories]
-            
-            with open(output_path, "w") as f:
-                if pretty_json:
-                    json.dump(data, f, indent=2, default=str)
-                else:
-                    json.dump(data, f, default=str)
+            # orjson serializes the dataclasses and their datetimes natively
+            option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC
+            if pretty_json:
+                option |= orjson.OPT_INDENT_2
+            await self._write_output(output_path, orjson.dumps(repositories, option=option))
         
         elif format_type == "csv":
             import csv
-            
-            with open(output_path, "w", newline="") as f:
-                if repositories:
-                    writer = csv.DictWriter(f, fieldnames=repositories[0].dict().keys())
-                    writer.writeheader()
-                    for repo in repositories:
-                        # Convert datetime objects to strings
-                        row = {k: str(v) if hasattr(v, 'isoformat') else v 
-                               for k, v in repo.dict().items()}
-                        writer.writerow(row)
+            import io
+            from operator import attrgetter
+
+            # Rows are encoded to UTF-8 as they are written, so the export
+            # is never held as both a str and its encoded bytes
+            buffer = io.BytesIO()
+            text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+            if repositories:
+                # csv writes str() of datetimes and other non-string values
+                fieldnames = [f.name for f in fields(Repository)]
+                writer = csv.writer(text)
+                writer.writerow(fieldnames)
+                # Rows are built in C by one attrgetter over all fields
+                writer.writerows(map(attrgetter(*fieldnames), repositories))
+            text.detach()  # flush, and leave buffer open for the write below
+            await self._write_output(output_path, buffer.getbuffer())
         
         elif format_type == "markdown":
             content = self._generate_basic_readme(
                 repositories, 
                 self._create_basic_analysis(repositories)
             )
-            output_path.write_text(content)
+            await self._write_output(output_path, content.encode("utf-8"))
         
         elif format_type == "html":
-            # Basic HTML export
-            html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>GitHub Reading List</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        .repo {{ margin: 20px 0; padding: 10px; border-left: 3px solid #0366d6; }}
-        .repo-name {{ font-size: 18px; font-weight: bold; }}
-        .repo-desc {{ color: #586069; margin: 5px 0; }}
-        .repo-meta {{ font-size: 12px; color: #888; }}
-    </style>
-</head>
-<body>
-    <h1>📚 GitHub Reading List</h1>
-    <p>Total repositories: {len(repositories)}</p>
-"""
-            
-            for repo in repositories:
-                html_content += f"""
-    <div class="repo">
-        <div class="repo-name">
-            <a href="{repo.html_url}" target="_blank">{repo.name}</a>
-        </div>
-        <div class="repo-desc">{repo.description or 'No description'}</div>
-        <div class="repo-meta">
-            ⭐ {repo.stargazers_count:,} stars • 
-            {repo.language or 'Unknown'} • 
-            Updated: {repo.updated_at.strftime('%Y-%m-%d') if repo.updated_at else 'Unknown'}
-        </div>
-    </div>
-"""
-            
-            html_content += """
-</body>
-</html>
-"""
-            output_path.write_text(html_content)
+            content = self.content_generator.generate_html_report(
+                repositories,
+                self._create_basic_analysis(repositories)
+            )
+            await self._write_output(output_path, content.encode("utf-8"))
+        
+        elif format_type == "parquet":
+            await asyncio.to_thread(self._write_parquet, repositories, output_path)
         
         else:
             raise ValueError(f"Unsupported export format: {format_type}")
@@ -0,0 +1,172 @@
+"""Rate limiting helpers for GitHub Reading List Generator."""
+
+import asyncio
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Mapping, Optional, Tuple
+
+# Statuses GitHub uses for primary and secondary rate limits
+RATE_LIMIT_STATUSES = frozenset({403, 429})
+
+# Bounds for waits derived from rate-limit headers
+MIN_RATE_LIMIT_WAIT = 1.0
+MAX_RATE_LIMIT_WAIT = 3600.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for a zero-based retry attempt."""
+    return 2 ** attempt + random.random()
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait according to Retry-After / X-RateLimit-Reset headers."""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            try:
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                pass
+
+    return None
+
+
+def respect_reset(
+    status: int,
+    headers: Mapping[str, str],
+    attempt: int = 0,
+) -> Optional[float]:
+    """Seconds to sleep before retrying a rate-limited response, or None.
+
+    The wait comes from Retry-After / X-RateLimit-Reset when present; a 429
+    without either falls back to exponential backoff, while a 403 without
+    either is an ordinary permission error and is not retried. Waits are
+    clamped and jittered so concurrent tasks do not retry in lockstep.
+    """
+    if status not in RATE_LIMIT_STATUSES:
+        return None
+
+    wait = retry_after_seconds(headers)
+    if wait is None:
+        if status != 429:
+            return None
+        wait = backoff_delay(attempt)
+
+    wait = min(max(wait, MIN_RATE_LIMIT_WAIT), MAX_RATE_LIMIT_WAIT)
+    return wait * random.uniform(0.9, 1.2)
+
+
+# OpenAI reset durations such as "1s", "6m0s" or "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _reset_from_epoch(value: str) -> float:
+    """Reset time from epoch seconds (GitHub)."""
+    return float(value)
+
+
+def _reset_from_duration(value: str) -> float:
+    """Reset time from a duration until the reset (OpenAI)."""
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return time.time() + sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def _reset_from_timestamp(value: str) -> float:
+    """Reset time from an RFC 3339 timestamp (Anthropic)."""
+    return datetime.fromisoformat(value).timestamp()
+
+
+# Request quota headers as (remaining, reset, reset parser), per API
+_QUOTA_HEADERS: Tuple[Tuple[str, str, Callable[[str], float]], ...] = (
+    ("X-RateLimit-Remaining", "X-RateLimit-Reset", _reset_from_epoch),
+    (
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-reset-requests",
+        _reset_from_duration,
+    ),
+    (
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-requests-reset",
+        _reset_from_timestamp,
+    ),
+)
+
+
+class RateLimiter:
+    """Per-host token bucket driven by rate-limit response headers.
+
+    Each acquisition spends one token from the last observed remaining
+    request quota: GitHub's ``X-RateLimit-Remaining``, OpenAI's
+    ``x-ratelimit-remaining-requests`` or Anthropic's
+    ``anthropic-ratelimit-requests-remaining``. Once the bucket is empty,
+    callers wait until the matching reset header (or ``Retry-After``)
+    before the bucket is considered refilled.
+    """
+
+    def __init__(self):
+        self._remaining: Dict[str, Optional[int]] = {}
+        self._reset_at: Dict[str, float] = {}
+
+    def update(self, host: str, headers: Mapping[str, str]) -> None:
+        """Record rate-limit state from response headers."""
+        for remaining_header, reset_header, parse_reset in _QUOTA_HEADERS:
+            remaining = headers.get(remaining_header)
+            if remaining is None:
+                continue
+
+            try:
+                self._remaining[host] = int(remaining)
+            except ValueError:
+                pass
+
+            reset = headers.get(reset_header)
+            if reset is not None:
+                try:
+                    self._reset_at[host] = parse_reset(reset)
+                except ValueError:
+                    pass
+            break
+
+        wait = retry_after_seconds(headers)
+        if wait is not None:
+            self._remaining[host] = 0
+            self._reset_at[host] = time.time() + wait
+
+    def _wait_time(self, host: str) -> float:
+        """Spend a token for host and return how long to wait before sending."""
+        remaining = self._remaining.get(host)
+        if remaining is None:
+            return 0.0
+
+        if remaining > 0:
+            self._remaining[host] = remaining - 1
+            return 0.0
+
+        # Bucket is empty; it refills at the reset time
+        wait = self._reset_at.get(host, 0.0) - time.time()
+        if wait <= 0:
+            # The next response will report the refreshed quota
+            self._remaining[host] = None
+            return 0.0
+        return wait
+
+    @asynccontextmanager
+    async def __call__(self, host: str) -> AsyncIterator[None]:
+        """Wait until a request to host is allowed."""
+        wait = self._wait_time(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        yield
@@ -17,13 +17,30 @@ async def main():
         # Load configuration
         config = load_config()
         
-        # Create and run pipeline
-        pipeline = Pipeline(config)
-        result = await pipeline.run()
+        # Create and run pipeline; repositories are fetched once and the
+        # README and every configured export are then written together
+        export_dir = Path(config.output.data_dir) / "exports"
+        export_dir.mkdir(parents=True, exist_ok=True)
+        
+        async with Pipeline(config) as pipeline:
+            repositories = await pipeline._fetch_repositories()
+            result, *exports = await asyncio.gather(
+                pipeline.run(repositories=repositories),
+                *(
+                    pipeline._write_format(
+                        format_type,
+                        export_dir / f"reading_list.{format_type}",
+                        repositories,
+                    )
+                    for format_type in config.output.formats
+                ),
+            )
         
         print(f"✅ Refresh completed successfully!")
         print(f"📊 Processed {result.total_repositories} repositories")
         print(f"📂 Output saved to: {result.output_path}")
+        for export in exports:
+            print(f"📤 Exported {export.record_count} records to {export.output_path}")
         
     except Exception as e:
         print(f"❌ Refresh failed: {e}")
@@ -0,0 +1,85 @@
+"""Shared fixtures for the test suite."""
+
+import httpx
+import pytest
+
+BASE_URL = "https://api.github.test"
+
+
+def make_repo(repo_id, detailed=False):
+    """Build a starred repository payload.
+
+    The minimal payload leaves every optional field out. A detailed one
+    fills every export column, with values that vary by repo_id.
+    """
+    repo = {
+        "id": repo_id,
+        "name": f"repo{repo_id}",
+        "full_name": f"owner/repo{repo_id}",
+        "description": None,
+        "html_url": f"https://github.com/owner/repo{repo_id}",
+        "stargazers_count": repo_id,
+        "language": "Python",
+    }
+    if detailed:
+        repo.update({
+            "description": None if repo_id % 3 == 0 else f'Tool, "quoted" ünïcode #{repo_id}',
+            "stargazers_count": repo_id * 700,
+            "language": ["Python", "Rust", None][repo_id % 3],
+            "topics": ["cli", "async"] if repo_id % 2 else [],
+            "created_at": "2020-01-01T00:00:00Z",
+            "updated_at": f"2024-03-{repo_id % 28 + 1:02d}T08:15:00Z",
+            "pushed_at": None if repo_id % 4 == 0 else "2024-04-02T10:00:00+00:00",
+            "license": {"key": "mit", "name": "MIT License"} if repo_id % 2 else None,
+            "archived": repo_id % 5 == 0,
+            "forks_count": repo_id,
+        })
+    return repo
+
+
+class FakeGitHub:
+    """Serve starred repositories in pages with ETags, recording requests."""
+
+    def __init__(self, total, per_page=10, detailed=False):
+        self.total = total
+        self.per_page = per_page
+        self.detailed = detailed
+        self.requests = []
+
+    @property
+    def last_page(self):
+        """Number of the final page."""
+        return max(1, -(-self.total // self.per_page))
+
+    def __call__(self, request):
+        """Answer one request."""
+        self.requests.append(request)
+        page = int(request.url.params["page"])
+        etag = f'"page-{page}"'
+        link = f'<{BASE_URL}/users/u/starred?page={self.last_page}>; rel="last"'
+
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+
+        start = (page - 1) * self.per_page
+        stop = min(start + self.per_page, self.total)
+        body = [make_repo(repo_id, self.detailed) for repo_id in range(start, stop)]
+        return httpx.Response(200, json=body, headers={"ETag": etag, "Link": link})
+
+
+@pytest.fixture
+def base_url():
+    """Base URL of the fake GitHub API."""
+    return BASE_URL
+
+
+@pytest.fixture(name="make_repo")
+def make_repo_fixture():
+    """Factory for starred repository payloads; see make_repo."""
+    return make_repo
+
+
+@pytest.fixture
+def fake_github():
+    """Factory for FakeGitHub transports: fake_github(total, per_page, detailed)."""
+    return FakeGitHub
@@ -0,0 +1,156 @@
+"""Tests for the AI analyzer."""
+
+import asyncio
+
+import orjson
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from reading_list import ai_analyzer
+from reading_list.ai_analyzer import AIAnalyzer
+from reading_list.config import Config
+from reading_list.github_client import Repository
+
+
+def make_repo(name, language="Python"):
+    """Build a repository with the given name."""
+    return Repository.from_api_response({
+        "id": hash(name) & 0xFFFF,
+        "name": name,
+        "full_name": f"owner/{name}",
+        "description": f"{name} description",
+        "html_url": f"https://github.com/owner/{name}",
+        "stargazers_count": 1,
+        "language": language,
+    })
+
+
+def openai_reply(content):
+    """Wrap reply text in an OpenAI chat completion payload."""
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+def batch_content(*results):
+    """Encode batch results as the JSON text a model replies with."""
+    return orjson.dumps(list(results)).decode()
+
+
+class TestAIAnalyzer:
+    """Test batched repository analysis against a local provider server."""
+
+    @pytest.fixture(autouse=True)
+    def analyzer(self, monkeypatch):
+        """Create an analyzer for an OpenAI provider with retries but no waiting."""
+        monkeypatch.setattr(ai_analyzer, "backoff_delay", lambda attempt: 0)
+        self.monkeypatch = monkeypatch
+        self.config = Config()
+        self.config.ai.provider = "openai"
+        self.config.ai.openai.api_key = "test-key"
+        self.config.ai.batch_size = 10
+        self.analyzer = AIAnalyzer(self.config)
+        self.repos = [make_repo("alpha"), make_repo("beta", language=None)]
+        self.requests = []
+
+    def analyze(self, *responses):
+        """Run analyze_repositories, answering requests with (status, body) in turn."""
+        replies = iter(responses)
+
+        async def handler(request):
+            self.requests.append(request.path)
+            status, body = next(replies)
+            return web.json_response(body, status=status)
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/v1/chat/completions", handler)
+            app.router.add_post("/v1/messages", handler)
+            async with TestServer(app) as server:
+                self.config.ai.openai.base_url = str(server.make_url("/v1"))
+                self.monkeypatch.setattr(
+                    ai_analyzer, "ANTHROPIC_API_URL", str(server.make_url("/v1/messages"))
+                )
+                return await self.analyzer.analyze_repositories(self.repos)
+
+        return asyncio.run(run())
+
+    def test_batch_results_matched_by_full_name(self):
+        """Test results are matched by full_name even when reordered."""
+        results = self.analyze((200, openai_reply(batch_content(
+            {"full_name": "owner/beta", "category": "Tools", "summary": "Beta."},
+            {"full_name": "owner/alpha", "category": "Web", "summary": "Alpha."},
+        ))))
+
+        assert results == [
+            {"category": "Web", "summary": "Alpha."},
+            {"category": "Tools", "summary": "Beta."},
+        ]
+        assert self.requests == ["/v1/chat/completions"]
+
+    def test_missing_items_fall_back(self):
+        """Test repositories missing from the reply use metadata."""
+        results = self.analyze((200, openai_reply(batch_content(
+            {"full_name": "owner/alpha", "category": "Web"},
+        ))))
+
+        assert results == [
+            {"category": "Web", "summary": "alpha description"},
+            {"category": "Unknown", "summary": "beta description"},
+        ]
+
+    def test_invalid_json_reply_falls_back(self):
+        """Test a reply that is not JSON falls back for the whole batch."""
+        results = self.analyze((200, openai_reply("Sure! Here you go:")))
+
+        assert results == [
+            {"category": "Python", "summary": "alpha description"},
+            {"category": "Unknown", "summary": "beta description"},
+        ]
+
+    @pytest.mark.parametrize("body", [
+        {"choices": []},
+        {"choices": None},
+        {"choices": [{"message": {"content": None}}]},
+        {"error": "overloaded"},
+    ])
+    def test_unexpected_response_shape_falls_back(self, body):
+        """Test malformed provider responses fall back instead of raising."""
+        results = self.analyze((200, body))
+
+        assert [result["category"] for result in results] == ["Python", "Unknown"]
+
+    def test_rate_limited_request_is_retried(self):
+        """Test a 429 response is retried and the retry's result used."""
+        results = self.analyze(
+            (429, {"error": "rate limited"}),
+            (200, openai_reply(batch_content(
+                {"full_name": "owner/alpha", "category": "Web", "summary": "Alpha."},
+            ))),
+        )
+
+        assert len(self.requests) == 2
+        assert results[0] == {"category": "Web", "summary": "Alpha."}
+
+    def test_anthropic_provider(self):
+        """Test Anthropic message replies are read from their content blocks."""
+        self.config.ai.provider = "anthropic"
+        self.config.ai.anthropic.api_key = "test-key"
+        content = batch_content(
+            {"full_name": "owner/alpha", "category": "Web", "summary": "Alpha."},
+        )
+        results = self.analyze((200, {"content": [{"type": "text", "text": content}]}))
+
+        assert self.requests == ["/v1/messages"]
+        assert results[0] == {"category": "Web", "summary": "Alpha."}
+
+    def test_no_api_key_uses_metadata(self):
+        """Test no requests are made when the provider has no API key."""
+        self.config.ai.openai.api_key = None
+        results = self.analyze()
+
+        assert self.requests == []
+        assert results[0] == {"category": "Python", "summary": "alpha description"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,39 @@
+"""Tests for the on-disk cache."""
+
+import pytest
+
+from reading_list.cache import CacheStore
+
+
+class TestCacheStore:
+    """Test the cache store."""
+
+    @pytest.fixture(autouse=True)
+    def store(self, tmp_path):
+        """Create a store in a temporary directory."""
+        self.store = CacheStore(tmp_path / "cache")
+
+    def test_missing_entry(self):
+        """Test unknown keys return None."""
+        assert self.store.get("missing") is None
+
+    def test_round_trip(self):
+        """Test stored entries are returned unchanged."""
+        entry = {"etag": '"abc"', "last_modified": None, "body": [{"id": 1}]}
+        self.store.set("key", entry)
+        assert self.store.get("key") == entry
+
+    def test_make_key_is_stable(self):
+        """Test keys depend only on their parts."""
+        key = CacheStore.make_key("GET", "https://api.github.com", [("page", 1)])
+        assert key == CacheStore.make_key("GET", "https://api.github.com", [("page", 1)])
+        assert key != CacheStore.make_key("GET", "https://api.github.com", [("page", 2)])
+
+    def test_corrupt_entry_is_ignored(self):
+        """Test unreadable entries are treated as missing."""
+        (self.store.directory / "bad.json").write_text("{not json")
+        assert self.store.get("bad") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -3,7 +3,8 @@
 import pytest
 from click.testing import CliRunner
 
-from reading_list.cli import cli
+from reading_list.cli import _status_impl, cli, main
+from reading_list.config import Config
 
 
 class TestCLI:
@@ -54,6 +55,26 @@ class TestCLI:
         result = self.runner.invoke(cli, ["status", "--help"])
         assert result.exit_code == 0
         assert "Show current status" in result.output
+    
+    def test_main_version_fast_path(self, capsys):
+        """Test main answers --version without Click."""
+        assert main(["--version"]) == 0
+        assert "0.1.0" in capsys.readouterr().out
+    
+    def test_main_status_fast_path(self, tmp_path, monkeypatch):
+        """Test main answers status without Click."""
+        monkeypatch.chdir(tmp_path)
+        assert main(["status"]) == 0
+        assert (tmp_path / "data").is_dir()
+    
+    def test_status_when_data_is_a_file(self, tmp_path, monkeypatch, capsys):
+        """Test status reports paths under a non-directory as missing."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").write_text("not a directory")
+        _status_impl(Config())
+        output = capsys.readouterr().out
+        assert "data/cache" in output
+        assert "Missing" in output
 
 
 if __name__ == "__main__":
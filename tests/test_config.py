@@ -0,0 +1,137 @@
+"""Tests for configuration loading."""
+
+import os
+import sys
+
+import pytest
+
+from reading_list.config import (
+    CategorizationConfig,
+    Config,
+    KeywordAutomaton,
+    _read_config_file,
+    load_config,
+)
+
+
+class TestLoadConfig:
+    """Test configuration loading and caching."""
+
+    @pytest.fixture(autouse=True)
+    def workdir(self, tmp_path, monkeypatch):
+        """Run each test in an isolated working directory."""
+        monkeypatch.chdir(tmp_path)
+        self.config_path = tmp_path / "config.yaml"
+        self.config_path.write_text("github:\n  username: octocat\n")
+
+    def test_load_config_from_file(self):
+        """Test values from the YAML file are applied."""
+        config = load_config(self.config_path)
+        assert config.github.username == "octocat"
+
+    def test_load_config_missing_file(self, tmp_path):
+        """Test defaults are used when the file does not exist."""
+        config = load_config(tmp_path / "missing.yaml")
+        assert config.github.base_url == "https://api.github.com"
+
+    def test_load_config_is_cached(self):
+        """Test loading an unchanged file reuses the parsed YAML."""
+        load_config(self.config_path)
+        hits = _read_config_file.cache_info().hits
+        load_config("config.yaml")
+        assert _read_config_file.cache_info().hits == hits + 1
+
+    def test_loaded_configs_are_independent(self, tmp_path):
+        """Test mutating one loaded config does not affect the next load."""
+        first = load_config(self.config_path)
+        first.github.username = "mutated"
+        first.output.data_dir = str(tmp_path / "elsewhere")
+
+        second = load_config(self.config_path)
+        assert second is not first
+        assert second.github.username == "octocat"
+        assert second.output.data_dir == "data"
+        assert not (tmp_path / "elsewhere").exists()
+
+    def test_load_config_reloads_on_change(self):
+        """Test editing the file invalidates the cached parse."""
+        first = load_config(self.config_path)
+        assert first.github.username == "octocat"
+
+        self.config_path.write_text("github:\n  username: hubot\n")
+        stat = self.config_path.stat()
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        second = load_config(self.config_path)
+        assert second.github.username == "hubot"
+
+    def test_load_config_reloads_on_size_change(self):
+        """Test an edit that leaves the mtime unchanged is still picked up."""
+        load_config(self.config_path)
+        stat = self.config_path.stat()
+
+        self.config_path.write_text("github:\n  username: monalisa\n")
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_config(self.config_path).github.username == "monalisa"
+
+    def test_reload_env(self, monkeypatch):
+        """Test environment overrides are re-read on reload_env()."""
+        monkeypatch.setenv("GITHUB_USERNAME", "from-env")
+        Config.reload_env()
+        try:
+            assert load_config(self.config_path).github.username == "from-env"
+        finally:
+            monkeypatch.undo()
+            Config.reload_env()
+
+
+class TestCategorizationConfig:
+    """Test keyword-based categorization."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.categorization = CategorizationConfig()
+
+    def test_match_language(self):
+        """Test languages are matched case-insensitively."""
+        assert self.categorization.match_categories("rust", "") == ["Systems Programming"]
+
+    def test_match_keywords(self):
+        """Test topic and custom-rule keywords are found in text."""
+        categories = self.categorization.match_categories(
+            None, "A Docker CLI for penetration-testing"
+        )
+        assert categories == ["DevOps", "CLI Tools", "Security", "Testing"]
+
+    def test_keywords_respect_word_boundaries(self):
+        """Test keywords embedded in longer words do not match."""
+        assert self.categorization.match_categories(None, "Send email from Swift") == []
+
+    @pytest.mark.parametrize("text", [
+        "éai naïve_ai",
+        "AI² ai½ ai",
+        "ci-cd and ci-cdx, unit-test",
+        "A Docker CLI for penetration-testing",
+        "Send email from Swift",
+        "",
+    ])
+    def test_regex_fallback_matches_automaton(self, text, monkeypatch):
+        """Test the regex fallback reports what pyahocorasick reports."""
+        pytest.importorskip("ahocorasick")
+        keywords = {
+            **self.categorization.keyword_automaton._keywords,
+            "ci": ("CI",),
+            "ai": ("AI",),
+        }
+        automaton = KeywordAutomaton(keywords)
+
+        monkeypatch.setitem(sys.modules, "ahocorasick", None)
+        fallback = KeywordAutomaton(keywords)
+        assert fallback._pattern is not None
+
+        assert list(fallback.iter(text)) == list(automaton.iter(text))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
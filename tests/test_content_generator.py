@@ -0,0 +1,57 @@
+"""Tests for content generation."""
+
+import pytest
+
+from reading_list.config import Config
+from reading_list.content_generator import ContentGenerator
+from reading_list.github_client import Repository
+
+
+class TestContentGenerator:
+    """Test README and HTML report rendering."""
+
+    @pytest.fixture(autouse=True)
+    def generator(self, tmp_path):
+        """Create a generator with an empty templates directory."""
+        self.config = Config()
+        self.config.output.data_dir = str(tmp_path / "data")
+        self.config.templates.directory = str(tmp_path / "templates")
+        (tmp_path / "templates").mkdir()
+        self.templates = tmp_path / "templates"
+        self.generator = ContentGenerator(self.config)
+        self.repos = [Repository.from_api_response({
+            "id": 1,
+            "name": "<tool>",
+            "full_name": "owner/tool",
+            "description": "A tool",
+            "html_url": "https://github.com/owner/tool",
+            "stargazers_count": 2500,
+            "language": "Python",
+        })]
+        self.analysis = {"categories": {"Python": self.repos}}
+
+    def test_builtin_readme(self):
+        """Test the packaged README template is used by default."""
+        content = self.generator.generate_readme(self.repos, self.analysis)
+        assert "- **Total Repositories**: 1" in content
+        assert "### Python (1 repositories)" in content
+        assert "**[<tool>](https://github.com/owner/tool)**⭐⭐" in content
+        assert content.endswith(")*\n")
+
+    def test_builtin_html_report_is_escaped(self):
+        """Test the packaged HTML report escapes repository fields."""
+        content = self.generator.generate_html_report(self.repos, self.analysis)
+        assert "&lt;tool&gt;" in content
+        assert "2,500 stars" in content
+
+    def test_templates_directory_overrides_builtin(self):
+        """Test a template in the configured directory takes precedence."""
+        (self.templates / self.config.templates.readme).write_text(
+            "{{ repositories | length }} repos"
+        )
+        generator = ContentGenerator(self.config)
+        assert generator.generate_readme(self.repos, self.analysis) == "1 repos"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,324 @@
+"""Tests for the GitHub client."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from reading_list.config import GitHubConfig
+from reading_list.github_client import (
+    GitHubAPIError,
+    GitHubClient,
+    RateLimitError,
+    Repository,
+    decode_repositories,
+)
+
+
+def make_node(repo_id):
+    """Build a minimal GraphQL starred repository node."""
+    return {
+        "databaseId": repo_id,
+        "name": f"repo{repo_id}",
+        "nameWithOwner": f"owner/repo{repo_id}",
+        "description": None,
+        "url": f"https://github.com/owner/repo{repo_id}",
+        "stargazerCount": repo_id,
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+        "createdAt": "2020-01-01T00:00:00Z",
+        "defaultBranchRef": None,
+        "issues": {"totalCount": 7},
+        "licenseInfo": {
+            "key": "mit",
+            "name": "MIT License",
+            "spdx_id": "MIT",
+            "url": "http://choosealicense.com/licenses/mit/",
+        },
+    }
+
+
+def fake_graphql(request):
+    """Serve two pages of starred repositories over GraphQL."""
+    assert request.url.path == "/graphql"
+    query = json.loads(request.content)["query"]
+    assert "issues(states: OPEN) { totalCount }" in query
+    assert "spdx_id: spdxId url" in query
+    cursor = json.loads(request.content)["variables"]["cursor"]
+    ids = [0, 1] if cursor is None else [2]
+    return httpx.Response(200, json={"data": {"user": {"starredRepositories": {
+        "pageInfo": {"endCursor": "next", "hasNextPage": cursor is None},
+        "nodes": [make_node(repo_id) for repo_id in ids],
+    }}}})
+
+
+def fetch_all(client, handler):
+    """Collect starred repositories using handler as the transport."""
+
+    async def run():
+        client._async_client = httpx.AsyncClient(
+            base_url=client.config.base_url, transport=httpx.MockTransport(handler)
+        )
+        try:
+            return [repo async for repo in client.get_starred_repositories("u", per_page=10)]
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+class TestRepository:
+    """Test the Repository model."""
+
+    def test_from_api_response_defaults(self, make_repo):
+        """Test optional fields fall back to their defaults."""
+        repo = Repository.from_api_response({**make_repo(1), "owner": {"login": "owner"}})
+        assert repo.topics == []
+        assert repo.default_branch == "main"
+        assert repo.created_at is None
+
+    def test_decode_repositories(self, make_repo):
+        """Test page decoding matches from_api_response, with or without msgspec."""
+        complete = {**make_repo(1), "created_at": "2020-01-01T00:00:00Z", "owner": {}}
+        partial = {key: value for key, value in make_repo(2).items() if key != "language"}
+        page = json.dumps([complete, partial]).encode()
+        assert decode_repositories(page) == [
+            Repository.from_api_response(complete),
+            Repository.from_api_response(partial),
+        ]
+
+    def test_dict_round_trip(self, make_repo):
+        """Test dict() output rebuilds an equal Repository."""
+        data = {**make_repo(1), "pushed_at": "2024-05-01T12:00:00Z"}
+        repo = Repository.from_api_response(data)
+        assert repo.pushed_at.tzinfo is not None
+        assert Repository.from_api_response(
+            {**repo.dict(), "pushed_at": data["pushed_at"]}
+        ) == repo
+
+
+class TestGetStarredRepositories:
+    """Test async starred repository fetching."""
+
+    @pytest.fixture(autouse=True)
+    def client(self, tmp_path, base_url, fake_github):
+        """Create a client with a temporary cache."""
+        self.fake_github = fake_github
+        self.client = GitHubClient(
+            GitHubConfig(base_url=base_url, username="u"),
+            cache_dir=tmp_path / "cache",
+        )
+
+    def test_pages_are_yielded_in_order(self):
+        """Test all pages are fetched and yielded in page order."""
+        server = self.fake_github(total=45)
+        repos = fetch_all(self.client, server)
+        assert [repo.id for repo in repos] == list(range(45))
+        assert len(server.requests) == 5
+
+    def test_single_page(self):
+        """Test a short first page needs no further requests."""
+        server = self.fake_github(total=3)
+        assert len(fetch_all(self.client, server)) == 3
+        assert len(server.requests) == 1
+
+    def test_not_modified_pages_use_cache(self):
+        """Test 304 responses are served from the cached bodies."""
+        server = self.fake_github(total=25)
+        first = fetch_all(self.client, server)
+        second = fetch_all(self.client, server)
+        assert [repo.id for repo in second] == [repo.id for repo in first]
+        assert all(r.headers.get("If-None-Match") for r in server.requests[3:])
+
+    def test_invalid_json_raises_api_error(self):
+        """Test a malformed page body raises GitHubAPIError."""
+        with pytest.raises(GitHubAPIError, match="Invalid JSON response"):
+            fetch_all(self.client, lambda request: httpx.Response(200, content=b"[{"))
+
+
+class TestRateLimitRetries:
+    """Test rate-limited requests are retried after their advertised wait."""
+
+    @pytest.fixture(autouse=True)
+    def client(self, base_url, fake_github, monkeypatch):
+        """Create a client whose retry sleeps are recorded, not awaited."""
+        self.sleeps = []
+
+        async def fake_sleep(delay):
+            self.sleeps.append(delay)
+
+        monkeypatch.setattr("reading_list.github_client.asyncio.sleep", fake_sleep)
+        self.client = GitHubClient(GitHubConfig(base_url=base_url, username="u"))
+        self.server = fake_github(total=3)
+        self.requests = []
+
+    def test_retry_after_then_success(self):
+        """Test a 429 with Retry-After is retried once and yields the page."""
+
+        def handler(request):
+            self.requests.append(request)
+            if len(self.requests) == 1:
+                return httpx.Response(429, headers={"Retry-After": "2"})
+            return self.server(request)
+
+        repos = fetch_all(self.client, handler)
+        assert [repo.id for repo in repos] == [0, 1, 2]
+        assert len(self.requests) == 2
+        assert len(self.sleeps) == 1
+        assert 2 * 0.9 <= self.sleeps[0] <= 2 * 1.2
+
+    def test_final_attempt_raises_rate_limit_error(self):
+        """Test a 429 on the last attempt raises RateLimitError."""
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": "1"})
+
+        with pytest.raises(RateLimitError):
+            fetch_all(self.client, handler)
+        attempts = self.client.config.retry_attempts + 1
+        assert len(self.requests) == attempts
+        assert len(self.sleeps) == attempts - 1
+
+    def test_forbidden_without_reset_is_not_retried(self):
+        """Test a plain 403 is an immediate error, not a rate limit wait."""
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(403)
+
+        with pytest.raises(RateLimitError):
+            fetch_all(self.client, handler)
+        assert len(self.requests) == 1
+        assert self.sleeps == []
+
+
+@pytest.fixture
+def http_server():
+    """Run a local HTTP server; assign server.respond to answer requests.
+
+    respond(request_headers) returns (status, headers, body). The sync
+    client goes through requests and urllib3, so their retry handling is
+    exercised as well.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.requests.append(dict(self.headers))
+            status, headers, body = server.respond(self.headers)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestMakeRequest:
+    """Test the synchronous request path."""
+
+    @pytest.fixture(autouse=True)
+    def client(self, http_server, tmp_path, monkeypatch):
+        """Create a sync client against the local server, recording sleeps."""
+        self.sleeps = []
+        monkeypatch.setattr("reading_list.github_client.time.sleep", self.sleeps.append)
+        self.server = http_server
+        self.client = GitHubClient(
+            GitHubConfig(base_url=http_server.url, username="u", retry_attempts=2),
+            cache_dir=tmp_path / "cache",
+        )
+        self.client.session.trust_env = False
+
+    def test_rate_limit_retries_are_not_multiplied(self):
+        """Test a 429 with Retry-After is retried by _make_request alone."""
+        self.server.respond = lambda headers: (429, {"Retry-After": "1"}, b"")
+        with pytest.raises(RateLimitError):
+            self.client._make_request("GET", "users/u/starred")
+        assert len(self.server.requests) == 3
+        assert len(self.sleeps) == 2
+
+    def test_retry_after_then_success(self, make_repo):
+        """Test a rate-limited request returns the retried response."""
+        responses = iter([
+            (429, {"Retry-After": "1"}, b""),
+            (200, {}, json.dumps([make_repo(1)]).encode()),
+        ])
+        self.server.respond = lambda headers: next(responses)
+        assert self.client._make_request("GET", "users/u/starred") == [make_repo(1)]
+        assert len(self.server.requests) == 2
+        assert len(self.sleeps) == 1
+
+    def test_not_modified_uses_cached_body(self, make_repo):
+        """Test a 304 revalidation returns the body cached with its ETag."""
+        body = json.dumps([make_repo(1)]).encode()
+
+        def respond(headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"'}, body
+
+        self.server.respond = respond
+        first = self.client._make_request("GET", "users/u/starred")
+        second = self.client._make_request("GET", "users/u/starred")
+        assert second == first == [make_repo(1)]
+        assert self.server.requests[1].get("If-None-Match") == '"v1"'
+
+
+class TestGraphQLStarredRepositories:
+    """Test fetching starred repositories over GraphQL."""
+
+    def test_graphql_pages_are_mapped(self, base_url):
+        """Test GraphQL nodes are paginated and mapped onto Repository."""
+        client = GitHubClient(GitHubConfig(
+            base_url=base_url, username="u", GITHUB_TOKEN="token", use_graphql=True
+        ))
+        repos = fetch_all(client, fake_graphql)
+        assert [repo.full_name for repo in repos] == [
+            "owner/repo0", "owner/repo1", "owner/repo2"
+        ]
+        assert repos[0].language == "Python"
+        assert repos[0].topics == ["cli"]
+        assert repos[0].default_branch == "main"
+        assert repos[0].created_at.year == 2020
+        assert repos[2].watchers_count == repos[2].stargazers_count == 2
+        assert repos[0].open_issues_count == 7
+        assert repos[0].license == {
+            "key": "mit",
+            "name": "MIT License",
+            "spdx_id": "MIT",
+            "url": "http://choosealicense.com/licenses/mit/",
+        }
+
+    def test_enterprise_graphql_url(self):
+        """Test GitHub Enterprise REST URLs map to their GraphQL endpoint."""
+        client = GitHubClient(GitHubConfig(base_url="https://ghe.test/api/v3"))
+        assert client._graphql_url() == "https://ghe.test/api/graphql"
+
+    def test_invalid_graphql_json_raises_api_error(self, base_url):
+        """Test a malformed GraphQL body raises GitHubAPIError."""
+        client = GitHubClient(GitHubConfig(
+            base_url=base_url, username="u", GITHUB_TOKEN="token", use_graphql=True
+        ))
+        with pytest.raises(GitHubAPIError, match="Invalid JSON response"):
+            fetch_all(client, lambda request: httpx.Response(200, content=b"<html>"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,302 @@
+"""Tests for the processing pipeline."""
+
+import asyncio
+import csv
+import io
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+
+from reading_list import content_generator
+from reading_list.config import Config
+from reading_list.github_client import Repository
+from reading_list.pipeline import Pipeline
+
+NOW = datetime(2024, 5, 1, 12, 30, 0)
+
+
+def legacy_json(repositories, pretty_json=False):
+    """JSON export as written before Repository was serialized directly."""
+    option = orjson.OPT_INDENT_2 if pretty_json else 0
+    return orjson.dumps([repo.dict() for repo in repositories], option=option)
+
+
+def legacy_csv(repositories):
+    """CSV export as written through csv.DictWriter over Repository.dict()."""
+    buffer = io.StringIO(newline="")
+    if repositories:
+        writer = csv.DictWriter(buffer, fieldnames=repositories[0].dict().keys())
+        writer.writeheader()
+        for repo in repositories:
+            row = {k: str(v) if hasattr(v, 'isoformat') else v
+                   for k, v in repo.dict().items()}
+            writer.writerow(row)
+    return buffer.getvalue().encode("utf-8")
+
+
+def legacy_markdown(repositories, analysis_result):
+    """README as rendered by the f-string generator before Jinja templates."""
+    parts = [f"""# 📚 My GitHub Reading List
+
+Generated on {NOW.strftime('%Y-%m-%d %H:%M:%S')}
+
+## 📊 Summary
+
+- **Total Repositories**: {len(repositories)}
+- **Categories**: {len(analysis_result.get('categories', {}))}
+
+## 📋 Repositories by Category
+
+"""]
+    for category, repos in analysis_result.get("categories", {}).items():
+        parts.append(f"\n### {category} ({len(repos)} repositories)\n\n")
+        for repo in repos[:10]:
+            stars = "⭐" * min(5, repo.stargazers_count // 1000)
+            parts.append(f"- **[{repo.name}]({repo.html_url})**{stars}\n")
+            if repo.description:
+                parts.append(f"  {repo.description}\n")
+            parts.append(f"  *{repo.stargazers_count:,} stars • {repo.language or 'Unknown'}*\n\n")
+        if len(repos) > 10:
+            parts.append(f"  ... and {len(repos) - 10} more repositories\n\n")
+    parts.append("""
+---
+
+*Generated by [GitHub Reading List Generator](https://github.com/usathyan/reading-list)*
+""")
+    return "".join(parts).encode("utf-8")
+
+
+class TestPipeline:
+    """Test repository reuse and exports."""
+
+    @pytest.fixture(autouse=True)
+    def pipeline_config(self, tmp_path, base_url, fake_github):
+        """Create a config writing into a temporary data directory."""
+        self.config = Config()
+        self.config.output.data_dir = str(tmp_path / "data")
+        self.config.github.base_url = base_url
+        self.config.github.username = "u"
+        self.config.performance.request_delay = 0
+        self.config.features.enable_visualizations = False
+        self.config.create_directories()
+        self.out = tmp_path / "out"
+        self.out.mkdir()
+        self.server = fake_github(total=25, detailed=True)
+
+    def make_pipeline(self):
+        """Create a pipeline."""
+        return Pipeline(self.config)
+
+    def run_with(self, pipeline, *calls):
+        """Await each (method name, *args) call in one fake GitHub session."""
+
+        async def run():
+            pipeline.github_client._async_client = httpx.AsyncClient(
+                base_url=self.config.github.base_url,
+                transport=httpx.MockTransport(self.server),
+            )
+            async with pipeline:
+                return [await getattr(pipeline, name)(*args) for name, *args in calls]
+
+        return asyncio.run(run())
+
+    def test_second_export_makes_no_requests(self):
+        """Test a run followed by exports fetches from GitHub once."""
+        self.run_with(
+            self.make_pipeline(),
+            ("run", False, True),
+            ("export", "json", self.out / "a.json"),
+            ("export", "csv", self.out / "a.csv"),
+        )
+        assert len(self.server.requests) == 3
+
+    def test_force_refresh_refetches(self):
+        """Test run(force_refresh=True) bypasses the cached repositories."""
+        self.run_with(
+            self.make_pipeline(),
+            ("export", "json", self.out / "a.json"),
+            ("run", True, True),
+        )
+        assert len(self.server.requests) == 6
+
+    def test_new_pipeline_reloads_from_disk(self):
+        """Test a fresh pipeline reads the persisted list back unchanged."""
+        first = self.make_pipeline()
+        (fetched,) = self.run_with(first, ("_fetch_repositories",))
+
+        second = self.make_pipeline()
+        (reloaded,) = self.run_with(second, ("_fetch_repositories",))
+
+        assert len(self.server.requests) == 3
+        assert reloaded == fetched
+        assert reloaded[1].created_at == fetched[1].created_at
+        assert reloaded[1].created_at.tzinfo is not None
+
+    @pytest.mark.parametrize("new_pipeline", [False, True])
+    def test_cache_is_keyed_on_host(self, new_pipeline):
+        """Test a different github.base_url never reuses the cached list."""
+        pipeline = self.make_pipeline()
+        self.run_with(pipeline, ("_fetch_repositories",))
+
+        self.config.github.base_url = "https://ghe.test/api/v3"
+        if new_pipeline:
+            pipeline = self.make_pipeline()
+        self.run_with(pipeline, ("_fetch_repositories",))
+        assert len(self.server.requests) == 6
+
+    def test_disabled_cache_is_not_persisted(self):
+        """Test enable_cache=False keeps repositories out of the disk cache."""
+        self.config.github.enable_cache = False
+        first = self.make_pipeline()
+        assert first._repo_store is None
+        self.run_with(first, ("_fetch_repositories",), ("_fetch_repositories",))
+        assert len(self.server.requests) == 3
+
+        self.run_with(self.make_pipeline(), ("_fetch_repositories",))
+        assert len(self.server.requests) == 6
+
+    def test_expired_ttl_refetches(self, monkeypatch):
+        """Test repositories older than github.cache_ttl are fetched again."""
+        clock = [1000.0]
+        monkeypatch.setattr("reading_list.pipeline.time.time", lambda: clock[0])
+        pipeline = self.make_pipeline()
+
+        self.run_with(pipeline, ("_fetch_repositories",))
+        clock[0] += self.config.github.cache_ttl - 1
+        self.run_with(pipeline, ("_fetch_repositories",))
+        assert len(self.server.requests) == 3
+
+        clock[0] += 1
+        self.run_with(pipeline, ("_fetch_repositories",))
+        assert len(self.server.requests) == 6
+
+    def test_run_uses_ai_analysis(self):
+        """Test run() categorizes repositories through the AI analyzer."""
+        self.config.ai.provider = "openai"
+        self.config.ai.openai.api_key = "test-key"
+        pipeline = self.make_pipeline()
+        analyzed = []
+
+        async def analyze_repositories(repositories):
+            analyzed.extend(repositories)
+            return [
+                {"category": "Tools" if repo.id % 2 else "Web", "summary": repo.name}
+                for repo in repositories
+            ]
+
+        pipeline.ai_analyzer.analyze_repositories = analyze_repositories
+        (result,) = self.run_with(pipeline, ("run",))
+
+        assert len(analyzed) == result.total_repositories == 25
+        assert result.total_categories == 2
+        readme = (Path(self.config.output.data_dir) / "README.md").read_text()
+        assert "### Web (13 repositories)" in readme
+        assert "### Tools (12 repositories)" in readme
+
+    def test_run_without_ai_key_uses_basic_analysis(self):
+        """Test run() groups by language when the AI provider has no key."""
+        self.config.ai.provider = "openai"
+        self.config.ai.openai.api_key = None
+        (result,) = self.run_with(self.make_pipeline(), ("run",))
+        assert result.total_categories == 3
+
+    @pytest.mark.parametrize("pretty_json", [False, True])
+    def test_json_export_is_byte_identical(self, pretty_json):
+        """Test JSON export matches dumping Repository.dict() records."""
+        path = self.out / "a.json"
+        repos, _ = self.run_with(
+            self.make_pipeline(),
+            ("_fetch_repositories",),
+            ("export", "json", path, pretty_json),
+        )
+        assert path.read_bytes() == legacy_json(repos, pretty_json)
+
+    def test_csv_export_is_byte_identical(self):
+        """Test CSV export matches the DictWriter output."""
+        path = self.out / "a.csv"
+        repos, _ = self.run_with(
+            self.make_pipeline(),
+            ("_fetch_repositories",),
+            ("export", "csv", path),
+        )
+        assert path.read_bytes() == legacy_csv(repos)
+
+    def test_markdown_export_is_byte_identical(self, monkeypatch):
+        """Test the markdown template matches the f-string README."""
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return NOW
+
+        monkeypatch.setattr(content_generator, "datetime", FrozenDatetime)
+        path = self.out / "a.md"
+        pipeline = self.make_pipeline()
+        repos, _ = self.run_with(
+            pipeline,
+            ("_fetch_repositories",),
+            ("export", "markdown", path),
+        )
+        assert path.read_bytes() == legacy_markdown(
+            repos, pipeline._create_basic_analysis(repos)
+        )
+
+    def test_empty_exports(self):
+        """Test exports of an empty starred list."""
+        self.server.total = 0
+        self.run_with(
+            self.make_pipeline(),
+            ("export", "json", self.out / "a.json"),
+            ("export", "csv", self.out / "a.csv"),
+        )
+        assert (self.out / "a.json").read_bytes() == b"[]"
+        assert (self.out / "a.csv").read_bytes() == b""
+
+
+class TestParquetExport:
+    """Test the typed Parquet export."""
+
+    @pytest.fixture(autouse=True)
+    def parquet(self, tmp_path):
+        """Skip unless pyarrow is installed."""
+        self.pa = pytest.importorskip("pyarrow")
+        self.pq = pytest.importorskip("pyarrow.parquet")
+        self.path = tmp_path / "repos.parquet"
+
+    def test_empty_export_has_all_columns(self):
+        """Test an empty export still writes every typed column."""
+        Pipeline._write_parquet([], self.path)
+        schema = self.pq.read_schema(self.path)
+        assert schema.names == list(Repository.__dataclass_fields__)
+        assert schema.field("created_at").type == self.pa.timestamp("us", tz="UTC")
+        assert schema.field("topics").type == self.pa.list_(self.pa.string())
+
+    def test_null_columns_keep_their_types(self, make_repo):
+        """Test columns that are null in every row are not typed as null."""
+        repos = [Repository.from_api_response(make_repo(i, detailed=True)) for i in (0, 6)]
+        assert all(r.description is None and r.license is None for r in repos)
+        Pipeline._write_parquet(repos, self.path)
+
+        table = self.pq.read_table(self.path)
+        assert table.schema.field("description").type == self.pa.string()
+        assert self.pa.types.is_struct(table.schema.field("license").type)
+        assert table.num_rows == 2
+
+    def test_values_round_trip(self, make_repo):
+        """Test values read back match the exported repositories."""
+        repos = [Repository.from_api_response(make_repo(i, detailed=True)) for i in range(1, 4)]
+        Pipeline._write_parquet(repos, self.path)
+
+        rows = self.pq.read_table(self.path).to_pylist()
+        assert [row["topics"] for row in rows] == [repo.topics for repo in repos]
+        assert [row["pushed_at"] for row in rows] == [repo.pushed_at for repo in repos]
+        assert rows[0]["license"] == {
+            "key": "mit", "name": "MIT License", "spdx_id": None, "url": None
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
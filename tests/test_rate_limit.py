@@ -0,0 +1,112 @@
+"""Tests for rate limiting helpers."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+from multidict import CIMultiDict
+
+from reading_list.rate_limit import RateLimiter, respect_reset, retry_after_seconds
+
+
+class TestRetryAfterSeconds:
+    """Test header parsing for retry delays."""
+
+    def test_retry_after_header(self):
+        """Test Retry-After is used as a delay in seconds."""
+        assert retry_after_seconds({"Retry-After": "7"}) == 7.0
+
+    def test_rate_limit_reset_header(self):
+        """Test X-RateLimit-Reset is used once the quota is exhausted."""
+        reset = str(int(time.time()) + 30)
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+        assert 0 < retry_after_seconds(headers) <= 30
+
+    def test_no_rate_limit_headers(self):
+        """Test no delay is suggested without rate-limit headers."""
+        assert retry_after_seconds({"X-RateLimit-Remaining": "42"}) is None
+
+
+class TestRespectReset:
+    """Test retry waits for rate-limited responses."""
+
+    def test_retry_after_is_jittered(self):
+        """Test Retry-After is honoured with bounded jitter."""
+        wait = respect_reset(429, {"Retry-After": "10"})
+        assert 9 <= wait <= 12
+
+    def test_wait_is_clamped(self):
+        """Test waits are clamped to between one second and one hour."""
+        assert 0.9 <= respect_reset(429, {"Retry-After": "0"}) <= 1.2
+        assert respect_reset(429, {"Retry-After": "86400"}) <= 3600 * 1.2
+
+    def test_plain_forbidden_is_not_retried(self):
+        """Test a 403 without rate-limit headers is not retried."""
+        assert respect_reset(403, {"X-RateLimit-Remaining": "10"}) is None
+
+    def test_other_statuses_are_not_retried(self):
+        """Test non rate-limit statuses are not retried."""
+        assert respect_reset(200, {"Retry-After": "5"}) is None
+
+
+class TestRateLimiter:
+    """Test the per-host rate limiter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.limiter = RateLimiter()
+
+    def test_unknown_host_is_not_limited(self):
+        """Test hosts without observed headers are never delayed."""
+        assert self.limiter._wait_time("api.example.com") == 0.0
+
+    def test_tokens_are_spent(self):
+        """Test each acquisition spends one remaining token."""
+        self.limiter.update("api.example.com", {"X-RateLimit-Remaining": "1"})
+        assert self.limiter._wait_time("api.example.com") == 0.0
+        assert self.limiter._remaining["api.example.com"] == 0
+
+    def test_empty_bucket_waits_for_reset(self):
+        """Test an exhausted bucket waits until the advertised reset."""
+        self.limiter.update("api.example.com", {"Retry-After": "5"})
+        assert 4 < self.limiter._wait_time("api.example.com") <= 5
+
+    def test_openai_request_quota(self):
+        """Test OpenAI's remaining requests and reset duration are used."""
+        self.limiter.update("api.openai.com", CIMultiDict({
+            "X-RateLimit-Remaining-Requests": "0",
+            "X-RateLimit-Reset-Requests": "1m30s",
+            "X-RateLimit-Remaining-Tokens": "150000",
+        }))
+        assert 89 < self.limiter._wait_time("api.openai.com") <= 90
+
+    def test_openai_millisecond_reset(self):
+        """Test sub-second OpenAI reset durations are parsed."""
+        self.limiter.update("api.openai.com", {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "1s500ms",
+        })
+        assert 1 < self.limiter._wait_time("api.openai.com") <= 1.5
+
+    def test_anthropic_request_quota(self):
+        """Test Anthropic's remaining requests and RFC 3339 reset are used."""
+        reset = datetime.fromtimestamp(time.time() + 30, timezone.utc)
+        self.limiter.update("api.anthropic.com", {
+            "anthropic-ratelimit-requests-remaining": "2",
+            "anthropic-ratelimit-requests-reset": reset.isoformat().replace("+00:00", "Z"),
+        })
+        assert self.limiter._wait_time("api.anthropic.com") == 0.0
+        assert self.limiter._wait_time("api.anthropic.com") == 0.0
+        assert 29 < self.limiter._wait_time("api.anthropic.com") <= 30
+
+    def test_invalid_reset_is_ignored(self):
+        """Test an unparseable reset leaves no wait behind."""
+        self.limiter.update("api.openai.com", {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "soon",
+        })
+        assert self.limiter._wait_time("api.openai.com") == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])